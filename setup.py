@@ -27,9 +27,11 @@ setup(
     python_requires=">=3.9",
     install_requires=[
         "requests>=2.31.0",
+        "urllib3>=2.0.0",
+        "orjson>=3.0",
         "pyyaml>=6.0",
         "pandas>=2.0.0",
-        "click>=8.1.0",
+        "numpy>=1.22.0",
         "python-dateutil>=2.8.0",
         "tabulate>=0.9.0",
     ],
@@ -4,9 +4,190 @@ SportsCardsPro API Client
 This module provides a client for interacting with the SportsCardsPro API.
 """
 
+import atexit
+import threading
 import time
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Hashable, Iterable, Union
+from urllib.parse import quote
+
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+# Normalized field name -> API response field name. parse_product_data
+# spells the same mapping out as a dict literal, which CPython builds
+# faster than a loop or zip over these tuples; keep the two in sync.
+_TEXT_FIELDS = (
+    ('product_name', 'product-name'),
+    ('console_name', 'console-name'),
+    ('genre', 'genre'),
+    ('release_date', 'release-date'),
+)
+
+_PRICE_FIELDS = (
+    ('loose_price', 'loose-price'),
+    ('psa_10_price', 'manual-only-price'),
+    ('grade_9_price', 'graded-price'),
+    ('grade_8_price', 'new-price'),
+    ('grade_7_price', 'cib-price'),
+    ('bgs_10_price', 'bgs-10-price'),
+    ('cgc_10_price', 'condition-17-price'),
+    ('sgc_10_price', 'condition-18-price'),
+)
+
+
+def _parse_price(price_value: Any) -> int:
+    """
+    Parse price value to cents (integer).
+
+    The API reports prices as integer pennies, so that case is checked
+    first and returned as-is. Dollar amounts are rounded to the nearest
+    cent rather than truncated, so they never pick up float rounding
+    error (e.g. "0.29" is 29 cents, not 28). Values of 1000 or more are
+    assumed to already be in cents.
+
+    Args:
+        price_value: Price value from API (can be string, int, float, or None)
+
+    Returns:
+        Price in cents as integer, or 0 if invalid
+    """
+    # Fast path: already in cents (integer)
+    if type(price_value) is int:
+        return price_value
+
+    if price_value is None or price_value == '':
+        return 0
+    
+    try:
+        # Floats or strings in dollars. float() parses in C and scaling
+        # by 100 stays well within half a cent of the true value, so
+        # rounding recovers the exact cent amount.
+        price_float = float(price_value)
+        return round(price_float * 100) if price_float < 1000 else int(price_float)
+    except (ValueError, TypeError):
+        return 0
+
+
+# Longest Retry-After wait honored, in seconds, so one rate-limited
+# response cannot stall a bulk update for as long as the server asks
+MAX_RETRY_AFTER = 30
+
+
+class _CappedRetry(Retry):
+    """Retry policy that waits at most MAX_RETRY_AFTER for Retry-After."""
+
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, MAX_RETRY_AFTER)
+
+
+# Sessions shared by every client for the same base URL, so keep-alive
+# connections survive across client instances in one process.
+_SESSIONS: Dict[str, requests.Session] = {}
+_SESSION_LOCK = threading.Lock()
+
+
+def _build_session(max_retries: int, backoff: float) -> requests.Session:
+    """
+    Create a session with a sized, keep-alive connection pool.
+
+    Retries are handled by urllib3 with jittered exponential backoff, so
+    transient connection errors and 5xx responses are retried without
+    re-entering Python-level retry logic or opening a fresh connection
+    each time. Rate-limited (429) responses wait for the server's
+    Retry-After header when it is sent, up to MAX_RETRY_AFTER seconds.
+
+    Args:
+        max_retries: Maximum number of retries per request
+        backoff: Initial backoff in seconds, doubled per retry
+
+    Returns:
+        Configured requests session
+    """
+    retry = _CappedRetry(
+        total=max_retries,
+        backoff_factor=backoff,
+        backoff_jitter=backoff,
+        backoff_max=5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=['GET'],
+        respect_retry_after_header=True
+    )
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def _get_session(base_url: str, max_retries: int, backoff: float) -> requests.Session:
+    """Return the shared session for base_url, creating it on first use."""
+    with _SESSION_LOCK:
+        session = _SESSIONS.get(base_url)
+        if session is None:
+            session = _SESSIONS[base_url] = _build_session(max_retries, backoff)
+        return session
+
+
+@atexit.register
+def _close_sessions():
+    """Close all shared sessions at interpreter exit."""
+    with _SESSION_LOCK:
+        for session in _SESSIONS.values():
+            session.close()
+        _SESSIONS.clear()
+
+
+class _TTLCache:
+    """Small thread-safe mapping whose entries expire after a fixed time."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries; the oldest is evicted first
+            ttl: Seconds an entry stays valid after it is stored
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: Dict[Hashable, tuple] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires < time.monotonic():
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key: Hashable, value: Any):
+        """Store value under key, evicting the oldest entry when full."""
+        with self._lock:
+            self._data.pop(key, None)
+            if len(self._data) >= self.maxsize:
+                del self._data[next(iter(self._data))]
+            self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
 
 
 class SportsCardsProAPI:
@@ -22,9 +203,18 @@ class SportsCardsProAPI:
         """
         self.api_token = api_token
         self.base_url = base_url.rstrip('/')
-        self.session = requests.Session()
         self.max_retries = 3
-        self.retry_delay = 1  # seconds
+        self.retry_delay = 0.1  # initial backoff in seconds, doubled per retry
+        self.session = _get_session(self.base_url, self.max_retries, self.retry_delay)
+
+        # Product lookups by ID only vary in the trailing ID, so the URL is
+        # built once instead of re-encoding a params dict on every call.
+        self._product_url = f"{self.base_url}/api/product?t={quote(api_token, safe='')}&id="
+
+        # Prices move on the order of hours, so repeated lookups are served
+        # from memory instead of re-issuing identical requests.
+        self._product_cache = _TTLCache(maxsize=4096, ttl=3600)
+        self._search_cache = _TTLCache(maxsize=1024, ttl=900)
 
     def _make_request(
         self, 
@@ -32,7 +222,9 @@ class SportsCardsProAPI:
         params: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
-        Make an authenticated request to the API with retry logic.
+        Make an authenticated request to the API.
+
+        Transient failures are retried by the session's transport adapter.
 
         Args:
             endpoint: API endpoint path
@@ -51,45 +243,65 @@ class SportsCardsProAPI:
         params['t'] = self.api_token
         
         url = f"{self.base_url}{endpoint}"
-        
-        for attempt in range(self.max_retries):
-            try:
-                response = self.session.get(url, params=params, timeout=10)
-                response.raise_for_status()
-                
-                data = response.json()
-                
-                # Check for API error status
-                if isinstance(data, dict):
-                    if data.get('status') == 'error':
-                        error_msg = data.get('error-message', 'Unknown API error')
-                        raise APIError(f"API Error: {error_msg}")
-                    
-                    if data.get('status') == 'success':
-                        return data
-                
-                # If no status field, return the data as is
-                return data
-                
-            except requests.exceptions.RequestException as e:
-                if attempt < self.max_retries - 1:
-                    time.sleep(self.retry_delay * (attempt + 1))
-                    continue
-                raise APIError(f"Request failed after {self.max_retries} attempts: {str(e)}")
-        
-        raise APIError("Max retries exceeded")
+
+        return self._get_json(url, params)
+
+    def _get_json(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Issue a GET request and decode its JSON body.
+
+        Args:
+            url: Fully built request URL
+            params: Query parameters to encode, if not already in the URL
+
+        Returns:
+            Parsed JSON response
+
+        Raises:
+            APIError: If the API returns an error or request fails
+        """
+        try:
+            response = self.session.get(url, params=params, timeout=10)
+            response.raise_for_status()
+        except (requests.exceptions.ConnectionError, requests.exceptions.RetryError) as e:
+            # urllib3 gave up after retrying connection errors or 429/5xx
+            raise APIError(f"Request failed after {self.max_retries} retries: {str(e)}")
+        except requests.exceptions.RequestException as e:
+            # Other HTTP errors (e.g. 4xx) are not retried
+            raise APIError(f"Request failed: {str(e)}")
+
+        try:
+            data = orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
+            raise APIError(f"Invalid JSON response: {str(e)}")
+
+        # Check for API error status
+        if isinstance(data, dict) and data.get('status') == 'error':
+            error_msg = data.get('error-message', 'Unknown API error')
+            raise APIError(f"API Error: {error_msg}")
+
+        return data
 
     def get_product(
         self, 
         product_id: Optional[int] = None, 
-        search_query: Optional[str] = None
+        search_query: Optional[str] = None,
+        refresh: bool = False
     ) -> Dict[str, Any]:
         """
         Get single card data by ID or search query.
 
+        Responses are cached for an hour per (product_id, search_query).
+
         Args:
             product_id: Product ID to fetch
             search_query: Search query string
+            refresh: Skip the cache and fetch current data, which is then
+                cached for later lookups (default: False)
 
         Returns:
             Product data dictionary
@@ -101,18 +313,100 @@ class SportsCardsProAPI:
         if product_id is None and search_query is None:
             raise ValueError("Either product_id or search_query must be provided")
         
-        params = {}
-        if product_id is not None:
-            params['id'] = product_id
-        if search_query is not None:
-            params['search'] = search_query
-        
-        return self._make_request('/api/product', params)
+        cache_key = (product_id, search_query)
+        if not refresh:
+            cached = self._product_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        if search_query is None:
+            # Encoded like params= would, so an ID cannot add query parameters
+            response = self._get_json(self._product_url + quote(str(product_id), safe=''))
+        else:
+            params = {'search': search_query}
+            if product_id is not None:
+                params['id'] = product_id
+            response = self._make_request('/api/product', params)
+
+        self._product_cache.set(cache_key, response)
+        return response
+
+    def get_products_bulk(
+        self,
+        product_ids: List[int],
+        max_workers: int = 8,
+        refresh: bool = False
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Get data for many cards by ID, fetching them concurrently.
+
+        Lookups are I/O bound, so running them on a thread pool over the
+        shared session overlaps their latency instead of paying it serially.
+
+        Args:
+            product_ids: Product IDs to fetch
+            max_workers: Maximum number of concurrent requests (default: 8)
+            refresh: Skip the cache, as in get_product (default: False)
+
+        Returns:
+            List of responses in the same order as ``product_ids``. A lookup
+            that failed is returned as its exception instead of a response,
+            so one bad ID does not abort the whole batch.
+        """
+        if not product_ids:
+            return []
+
+        def fetch(product_id: int) -> Union[Dict[str, Any], Exception]:
+            try:
+                return self.get_product(product_id=product_id, refresh=refresh)
+            except Exception as e:
+                return e
+
+        workers = min(max_workers, len(product_ids))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(fetch, product_ids))
+
+    def get_products_by_ids(
+        self,
+        product_ids: Iterable[int],
+        max_workers: int = 8,
+        refresh: bool = False
+    ) -> Dict[int, Union[Dict[str, Any], Exception]]:
+        """
+        Get product data for many card IDs in one batched call.
+
+        The API has no lookup by a list of IDs (/api/products only takes a
+        search query), so the batch is fetched client-side: duplicate IDs are
+        requested once and the lookups run concurrently via get_products_bulk.
+
+        Args:
+            product_ids: Product IDs to fetch
+            max_workers: Maximum number of concurrent requests (default: 8)
+            refresh: Skip the cache, as in get_product (default: False)
+
+        Returns:
+            Mapping of each product ID to its product data, unwrapped from
+            the response. A lookup that failed maps to its exception.
+        """
+        unique_ids = list(dict.fromkeys(product_ids))
+        responses = self.get_products_bulk(
+            unique_ids, max_workers=max_workers, refresh=refresh
+        )
+
+        products = {}
+        for product_id, response in zip(unique_ids, responses):
+            if isinstance(response, dict) and 'product' in response:
+                response = response['product']
+            products[product_id] = response
+
+        return products
 
     def get_products(self, search_query: str, limit: int = 50) -> List[Dict[str, Any]]:
         """
         Get multiple cards matching a search query.
 
+        Results are cached for fifteen minutes per (search_query, limit).
+
         Args:
             search_query: Search query string
             limit: Maximum number of results (default: 50)
@@ -123,6 +417,11 @@ class SportsCardsProAPI:
         Raises:
             APIError: If the API request fails
         """
+        cache_key = (search_query, limit)
+        cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         params = {
             'search': search_query,
             'limit': limit
@@ -132,11 +431,19 @@ class SportsCardsProAPI:
         
         # Extract products list from response
         if isinstance(response, dict) and 'products' in response:
-            return response['products']
+            products = response['products']
         elif isinstance(response, list):
-            return response
-        
-        return []
+            products = response
+        else:
+            products = []
+
+        self._search_cache.set(cache_key, products)
+        return products
+
+    def clear_cache(self):
+        """Discard all cached responses so the next lookups hit the API."""
+        self._product_cache.clear()
+        self._search_cache.clear()
 
     def parse_product_data(self, product: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -146,49 +453,87 @@ class SportsCardsProAPI:
             product: Raw product data from API
 
         Returns:
-            Normalized product data with standardized field names
+            Normalized product data with standardized field names; missing
+            or null text fields are '' and a missing or null sales volume is 0
         """
+        get = product.get
         return {
-            'id': product.get('id'),
-            'product_name': product.get('product-name', ''),
-            'console_name': product.get('console-name', ''),
-            'genre': product.get('genre', ''),
-            'release_date': product.get('release-date', ''),
-            'loose_price': self._parse_price(product.get('loose-price')),
-            'psa_10_price': self._parse_price(product.get('manual-only-price')),
-            'grade_9_price': self._parse_price(product.get('graded-price')),
-            'grade_8_price': self._parse_price(product.get('new-price')),
-            'grade_7_price': self._parse_price(product.get('cib-price')),
-            'bgs_10_price': self._parse_price(product.get('bgs-10-price')),
-            'cgc_10_price': self._parse_price(product.get('condition-17-price')),
-            'sgc_10_price': self._parse_price(product.get('condition-18-price')),
-            'sales_volume': product.get('sales-volume', 0)
+            'id': get('id'),
+            'product_name': get('product-name') or '',
+            'console_name': get('console-name') or '',
+            'genre': get('genre') or '',
+            'release_date': get('release-date') or '',
+            'loose_price': _parse_price(get('loose-price')),
+            'psa_10_price': _parse_price(get('manual-only-price')),
+            'grade_9_price': _parse_price(get('graded-price')),
+            'grade_8_price': _parse_price(get('new-price')),
+            'grade_7_price': _parse_price(get('cib-price')),
+            'bgs_10_price': _parse_price(get('bgs-10-price')),
+            'cgc_10_price': _parse_price(get('condition-17-price')),
+            'sgc_10_price': _parse_price(get('condition-18-price')),
+            'sales_volume': get('sales-volume') or 0
         }
 
+    def parse_products_data(self, products: Iterable[Dict[str, Any]]) -> 'pd.DataFrame':
+        """
+        Parse and normalize a batch of products into a DataFrame.
+
+        Produces the same columns and values as calling ``parse_product_data``
+        on each product, but converts every price column in one vectorized
+        pass, which is much cheaper for large search responses.
+
+        Args:
+            products: Raw product data from API, as a list or any iterable
+                (e.g. a generator over several responses)
+
+        Returns:
+            DataFrame with one row per product and normalized columns
+        """
+        import pandas as pd
+
+        # Lists are used as-is; only other iterables are materialized
+        records = products if isinstance(products, list) else list(products)
+        raw = pd.DataFrame(records, dtype=object)
+        parsed = pd.DataFrame(index=raw.index)
+
+        def column(source: str, default: Any) -> 'pd.Series':
+            if source not in raw:
+                return pd.Series(default, index=raw.index, dtype=object)
+            values = raw[source]
+            return values.where(values.notna(), default)
+
+        parsed['id'] = column('id', None)
+        for field, source in _TEXT_FIELDS:
+            parsed[field] = column(source, '')
+        for field, source in _PRICE_FIELDS:
+            parsed[field] = self._parse_price_column(column(source, 0))
+        parsed['sales_volume'] = column('sales-volume', 0)
+
+        return parsed
+
     @staticmethod
-    def _parse_price(price_value: Any) -> int:
+    def _parse_price_column(values: 'pd.Series') -> 'pd.Series':
         """
-        Parse price value to cents (integer).
+        Vectorized equivalent of ``_parse_price`` for a column of prices.
 
         Args:
-            price_value: Price value from API (can be string, int, float, or None)
+            values: Raw price values (object dtype)
 
         Returns:
-            Price in cents as integer, or 0 if invalid
+            Prices in cents as an int64 series, 0 where invalid
         """
-        if price_value is None or price_value == '':
-            return 0
-        
-        try:
-            # If already in cents (integer)
-            if isinstance(price_value, int):
-                return price_value
-            
-            # If float or string, convert to cents
-            price_float = float(price_value)
-            return int(price_float * 100) if price_float < 1000 else int(price_float)
-        except (ValueError, TypeError):
-            return 0
+        import pandas as pd
+
+        # Integers are already cents; everything else is dollars below 1000
+        is_cents = values.map(type).eq(int)
+        if is_cents.all():
+            return values.astype('int64')
+
+        numbers = pd.to_numeric(values, errors='coerce').fillna(0)
+        cents = numbers.where(is_cents | (numbers >= 1000), (numbers * 100).round())
+        return cents.astype('int64')
+
+    _parse_price = staticmethod(_parse_price)
 
 
 class APIError(Exception):
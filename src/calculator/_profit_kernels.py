@@ -0,0 +1,84 @@
+"""
+Profit Kernels
+
+Array math behind the batch profit calculations, written as NumPy
+operations that update an existing array where they can. Each step is its
+own pass over the arrays. Results match ProfitCalculator.calculate_profit
+value for value, including ROI rounding.
+"""
+
+from typing import Dict
+
+import numpy as np
+
+
+def profit_kernel(
+    purchase: np.ndarray,
+    market: np.ndarray,
+    shipping: np.ndarray,
+    fee_bps: int,
+    txn_fee_cents: int
+) -> Dict[str, np.ndarray]:
+    """
+    Compute fees, profit and ROI for arrays of integer cents.
+
+    Args:
+        purchase: Purchase prices in cents (int64)
+        market: Market values in cents (int64)
+        shipping: Shipping costs in cents (int64, same shape as market)
+        fee_bps: Final value fee in basis points
+        txn_fee_cents: Flat per-transaction fee in cents
+
+    Returns:
+        Dictionary of int64 arrays (ebay_fees, gross_profit, total_costs,
+        net_profit) and a float64 roi_percent array rounded to 2 places
+    """
+    ebay_fees = np.multiply(market, fee_bps)
+    ebay_fees += 5000
+    ebay_fees //= 10000
+    ebay_fees += txn_fee_cents
+
+    gross_profit = np.subtract(market, purchase)
+
+    total_costs = np.add(ebay_fees, shipping)
+
+    net_profit = np.subtract(gross_profit, total_costs)
+
+    # Same order as calculate_profit, (net / purchase) * 100, so the
+    # unrounded values are bit-identical; ROI stays 0 wherever there is no
+    # purchase price to divide by
+    has_purchase = purchase > 0
+    roi_percent = np.zeros(market.shape, dtype=np.float64)
+    np.divide(net_profit, purchase, out=roi_percent, where=has_purchase)
+    roi_percent *= 100.0
+    _round_like_python(roi_percent)
+
+    return {
+        'ebay_fees': ebay_fees,
+        'gross_profit': gross_profit,
+        'total_costs': total_costs,
+        'net_profit': net_profit,
+        'roi_percent': roi_percent
+    }
+
+
+def _round_like_python(values: np.ndarray):
+    """
+    Round values to 2 places in place, exactly as Python's round() would.
+
+    np.round scales by 100 and rounds the product, which can land on the
+    other side of a half than round()'s correctly rounded result. Only
+    values within a hair of a half can differ, so those few are redone with
+    round() itself.
+
+    Args:
+        values: float64 array, overwritten with the rounded values
+    """
+    scaled = values * 100.0
+    near_half = np.abs(np.remainder(scaled, 1.0) - 0.5) < 1e-6
+    ties = np.flatnonzero(near_half)
+
+    unrounded = values.flat[ties].tolist()
+    np.round(values, 2, out=values)
+    for i, value in zip(ties.tolist(), unrounded):
+        values.flat[i] = round(value, 2)
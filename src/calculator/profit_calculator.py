@@ -4,7 +4,16 @@ Profit Calculator
 This module provides utilities for calculating profits and ROI.
 """
 
-from typing import Dict, Any, Optional
+from typing import TYPE_CHECKING, Dict, Any, Optional
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import ArrayLike
+
+
+def _ebay_fees(sale_price_cents: int, fee_bps: int, txn_fee_cents: int) -> int:
+    """Final value fee rounded to the nearest cent, plus the flat fee."""
+    return (sale_price_cents * fee_bps + 5000) // 10000 + txn_fee_cents
 
 
 class ProfitCalculator:
@@ -28,6 +37,11 @@ class ProfitCalculator:
         self.ebay_transaction_fee = ebay_transaction_fee
         self.default_shipping_cost = default_shipping_cost
 
+        # Integer forms of the rates so fee math never touches floats
+        self._fee_bps = int(round(ebay_fee_percent * 100))  # basis points
+        self._txn_fee_cents = int(round(ebay_transaction_fee * 100))
+        self._default_shipping_cents = int(round(default_shipping_cost * 100))
+
     def calculate_ebay_fees(self, sale_price_cents: int) -> int:
         """
         Calculate total eBay fees.
@@ -38,16 +52,7 @@ class ProfitCalculator:
         Returns:
             Total eBay fees in cents
         """
-        sale_price_dollars = sale_price_cents / 100.0
-        
-        # Final value fee (percentage of sale price)
-        final_value_fee = sale_price_dollars * (self.ebay_fee_percent / 100.0)
-        
-        # Total fees in dollars
-        total_fees_dollars = final_value_fee + self.ebay_transaction_fee
-        
-        # Convert to cents
-        return int(total_fees_dollars * 100)
+        return _ebay_fees(sale_price_cents, self._fee_bps, self._txn_fee_cents)
 
     def calculate_profit(
         self,
@@ -67,7 +72,7 @@ class ProfitCalculator:
             Dictionary with profit calculation details
         """
         if shipping_cost_cents is None:
-            shipping_cost_cents = int(self.default_shipping_cost * 100)
+            shipping_cost_cents = self._default_shipping_cents
 
         # Calculate eBay fees based on market value
         ebay_fees = self.calculate_ebay_fees(market_value_cents)
@@ -93,6 +98,54 @@ class ProfitCalculator:
             'roi_percent': round(roi_percent, 2)
         }
 
+    def calculate_profit_batch(
+        self,
+        purchase_prices_cents: 'ArrayLike',
+        market_values_cents: 'ArrayLike',
+        shipping_costs_cents: Optional['ArrayLike'] = None
+    ) -> Dict[str, 'np.ndarray']:
+        """
+        Calculate potential profit for many card purchases at once.
+
+        Vectorized equivalent of ``calculate_profit`` for screening whole
+        inventories or search results without a Python loop per card. The
+        inputs broadcast against each other, so a single market value or
+        shipping cost can be paired with an array of purchase prices.
+
+        Args:
+            purchase_prices_cents: Purchase prices in cents
+            market_values_cents: Expected sale prices (market values) in cents
+            shipping_costs_cents: Shipping costs in cents (uses default if None)
+
+        Returns:
+            Dictionary with the same keys as ``calculate_profit``, each mapped
+            to an array with one entry per purchase
+        """
+        import numpy as np
+        from ._profit_kernels import profit_kernel
+
+        purchase, market = np.broadcast_arrays(
+            np.asarray(purchase_prices_cents, dtype=np.int64),
+            np.asarray(market_values_cents, dtype=np.int64)
+        )
+        if shipping_costs_cents is None:
+            shipping = np.full_like(market, self._default_shipping_cents)
+        else:
+            shipping = np.broadcast_to(
+                np.asarray(shipping_costs_cents, dtype=np.int64), market.shape
+            )
+
+        result = profit_kernel(
+            purchase, market, shipping, self._fee_bps, self._txn_fee_cents
+        )
+
+        return {
+            'purchase_price': purchase,
+            'market_value': market,
+            'shipping_cost': shipping,
+            **result
+        }
+
     def calculate_actual_profit(
         self,
         purchase_price_cents: int,
@@ -113,7 +166,7 @@ class ProfitCalculator:
             Dictionary with actual profit details
         """
         if shipping_cost_cents is None:
-            shipping_cost_cents = int(self.default_shipping_cost * 100)
+            shipping_cost_cents = self._default_shipping_cents
 
         gross_profit = sold_price_cents - purchase_price_cents
         total_costs = ebay_fees_cents + shipping_cost_cents
@@ -152,12 +205,54 @@ class ProfitCalculator:
         Returns:
             True if profitable above minimum margin, False otherwise
         """
-        profit_calc = self.calculate_profit(purchase_price_cents, market_value_cents)
-        roi_percent = profit_calc['roi_percent']
-        
-        return roi_percent >= min_profit_margin_percent
+        if purchase_price_cents <= 0:
+            return 0.0 >= min_profit_margin_percent
+
+        # Same formula as _ebay_fees, inlined to keep this check call-free
+        ebay_fees = (market_value_cents * self._fee_bps + 5000) // 10000 + self._txn_fee_cents
+        net_profit = (
+            market_value_cents - purchase_price_cents - ebay_fees - self._default_shipping_cents
+        )
+
+        # roi >= margin%  <=>  net * 100 / purchase >= margin, kept in integers
+        # (margin in basis points) so no result dict or float ROI is needed
+        min_margin_bps = int(round(min_profit_margin_percent * 100))
+        return net_profit * 10000 >= purchase_price_cents * min_margin_bps
+
+    def is_profitable_batch(
+        self,
+        purchase_prices_cents: 'ArrayLike',
+        market_values_cents: 'ArrayLike',
+        min_profit_margin_percent: float = 10.0
+    ) -> 'np.ndarray':
+        """
+        Check many purchases against a minimum profit margin at once.
+
+        Uses the same exact integer comparison as ``is_profitable``, so the
+        two agree at the margin boundary.
+
+        Args:
+            purchase_prices_cents: Purchase prices in cents
+            market_values_cents: Market values in cents
+            min_profit_margin_percent: Minimum profit margin percentage (default: 10.0)
+
+        Returns:
+            Boolean array, True where the purchase is profitable above the margin
+        """
+        import numpy as np
+
+        result = self.calculate_profit_batch(purchase_prices_cents, market_values_cents)
+        purchase = result['purchase_price']
+
+        min_margin_bps = int(round(min_profit_margin_percent * 100))
+        return np.where(
+            purchase > 0,
+            result['net_profit'] * 10000 >= purchase * min_margin_bps,
+            0.0 >= min_profit_margin_percent
+        )
 
-    def format_currency(self, cents: int) -> str:
+    @staticmethod
+    def format_currency(cents: int) -> str:
         """
         Format cents as currency string.
 
@@ -4,53 +4,105 @@ Command-Line Interface for Sports Card Tracker
 This module provides a CLI for interacting with the sports card tracker.
 """
 
+import argparse
+import json
 import os
 import sys
 from datetime import datetime, date
-from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, List, Optional
 
-import click
-import yaml
-from tabulate import tabulate
+# The API client, database, tracker and calculator modules (and yaml,
+# tabulate) are imported inside the commands that use them, so --help and
+# argument errors only pay for the standard library argparse.
+if TYPE_CHECKING:
+    from .api.sportscardspro import SportsCardsProAPI
+    from .calculator.profit_calculator import ProfitCalculator
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent))
+__all__ = [
+    'cli', 'build_parser', 'create_context', 'load_config',
+    'search', 'track', 'add_inventory', 'find_deals', 'calc_profit',
+    'inventory', 'record_sale', 'report', 'update_prices',
+]
 
-from api.sportscardspro import SportsCardsProAPI, APIError
-from database.models import Database
-from database.operations import CardOperations, PriceHistoryOperations, InventoryOperations
-from tracker.price_tracker import PriceTracker
-from tracker.deal_finder import DealFinder
-from calculator.profit_calculator import ProfitCalculator
+# Table headers for the list commands
+_SEARCH_HEADERS = ('#', 'ID', 'Product Name', 'Set', 'Ungraded', 'PSA 10')
+_DEAL_HEADERS = ('ID', 'Card', 'Market', 'Buy At', 'Trend', 'Profit', 'ROI')
+_INVENTORY_HEADERS = ('', 'ID', 'Card', 'Condition', 'Qty', 'Cost', 'Date', 'Profit')
 
 
 def load_config(config_path: str = "config.yaml") -> dict:
-    """Load configuration from YAML file."""
+    """
+    Load configuration from YAML file.
+
+    The parsed config is cached next to the YAML file as JSON, keyed by the
+    YAML file's modification time, so later runs skip the YAML parser.
+    """
     if not os.path.exists(config_path):
-        click.echo(f"Error: Configuration file '{config_path}' not found.")
-        click.echo("Please create a config.yaml file based on config.yaml.example")
+        print(f"Error: Configuration file '{config_path}' not found.")
+        print("Please create a config.yaml file based on config.yaml.example")
         sys.exit(1)
-    
+
+    cache_path = config_path + '.cache.json'
+    mtime_ns = os.stat(config_path).st_mtime_ns
+
+    try:
+        with open(cache_path, 'r') as f:
+            cached = json.load(f)
+        if cached.get('mtime_ns') == mtime_ns:
+            return cached['config']
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+
+    import yaml
+
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
     with open(config_path, 'r') as f:
-        return yaml.safe_load(f)
+        config = yaml.load(f, Loader=loader)
+
+    _write_config_cache(cache_path, {'mtime_ns': mtime_ns, 'config': config})
+    return config
+
 
+def _write_config_cache(cache_path: str, data: dict):
+    """Atomically write the JSON config cache, ignoring any failure."""
+    import tempfile
+
+    directory = os.path.dirname(os.path.abspath(cache_path))
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    except OSError:
+        return
 
-def get_api_client(config: dict) -> SportsCardsProAPI:
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+def get_api_client(config: dict) -> 'SportsCardsProAPI':
     """Create and return API client from config."""
+    from .api.sportscardspro import SportsCardsProAPI
+
     api_config = config.get('api', {})
     token = api_config.get('token', '')
     base_url = api_config.get('base_url', 'https://www.sportscardspro.com')
     
     if not token or token == 'YOUR_TOKEN_HERE':
-        click.echo("Error: Please set your API token in config.yaml")
+        print("Error: Please set your API token in config.yaml")
         sys.exit(1)
     
     return SportsCardsProAPI(token, base_url)
 
 
-def get_calculator(config: dict) -> ProfitCalculator:
+def get_calculator(config: dict) -> 'ProfitCalculator':
     """Create and return profit calculator from config."""
+    from .calculator.profit_calculator import ProfitCalculator
+
     business = config.get('business', {})
     return ProfitCalculator(
         ebay_fee_percent=business.get('ebay_fee_percent', 13.0),
@@ -59,106 +111,134 @@ def get_calculator(config: dict) -> ProfitCalculator:
     )
 
 
-@click.group()
-@click.pass_context
-def cli(ctx):
-    """Sports Card Price Tracker - Track prices and find profitable deals."""
-    ctx.ensure_object(dict)
+def _to_cents(dollars: float) -> int:
+    """
+    Convert a dollar amount to integer cents.
+
+    Rounds rather than truncates, since values like 0.29 * 100 come out as
+    28.999... in binary floating point.
+
+    Args:
+        dollars: Amount in dollars
+
+    Returns:
+        Amount in cents
+    """
+    return int(round(dollars * 100))
+
+
+class _Context(dict):
+    """Command context that opens the database on first access to 'db'."""
+
+    def __missing__(self, key):
+        if key != 'db':
+            raise KeyError(key)
+
+        from .database.models import Database
+
+        # Initialize database
+        db = Database()
+        db.initialize_schema()
+        self['db'] = db
+        return db
+
+
+def create_context() -> dict:
+    """
+    Load config for the commands.
+
+    The database is only opened when a command first looks up ctx['db'],
+    so commands like calc-profit never touch SQLite.
+    """
+    ctx = _Context()
     
     # Load config
-    ctx.obj['config'] = load_config()
-    
-    # Initialize database
-    db = Database()
-    db.initialize_schema()
-    ctx.obj['db'] = db
+    ctx['config'] = load_config()
+    return ctx
 
 
-@cli.command()
-@click.argument('query')
-@click.option('--limit', default=10, help='Maximum number of results')
-@click.pass_context
 def search(ctx, query: str, limit: int):
     """Search for cards by name or player."""
-    config = ctx.obj['config']
-    db = ctx.obj['db']
+    from tabulate import tabulate
+    from .api.sportscardspro import APIError
+    from .calculator.profit_calculator import ProfitCalculator
+    from .tracker.price_tracker import PriceTracker
+
+    config = ctx['config']
+    db = ctx['db']
     
     try:
         api = get_api_client(config)
         tracker = PriceTracker(db, api)
         
-        click.echo(f"Searching for: {query}")
-        results = tracker.search_and_track(query)
+        print(f"Searching for: {query}")
+        results = tracker.search_and_track(query, limit=limit)
         
         if not results:
-            click.echo("No results found.")
+            print("No results found.")
             return
         
         # Display results
+        format_currency = ProfitCalculator.format_currency
         table_data = []
-        for i, card in enumerate(results[:limit], 1):
+        for i, card in enumerate(results, 1):
             table_data.append([
                 i,
                 card['id'],
                 card['product_name'][:50],
                 card['console_name'][:30],
-                ProfitCalculator().format_currency(card['loose_price']),
-                ProfitCalculator().format_currency(card['psa_10_price'])
+                format_currency(card['loose_price']),
+                format_currency(card['psa_10_price'])
             ])
         
-        headers = ['#', 'ID', 'Product Name', 'Set', 'Ungraded', 'PSA 10']
-        click.echo(tabulate(table_data, headers=headers, tablefmt='grid'))
+        print(tabulate(table_data, headers=_SEARCH_HEADERS, tablefmt='simple'))
         
     except APIError as e:
-        click.echo(f"API Error: {str(e)}", err=True)
+        print(f"API Error: {str(e)}", file=sys.stderr)
     except Exception as e:
-        click.echo(f"Error: {str(e)}", err=True)
+        print(f"Error: {str(e)}", file=sys.stderr)
 
 
-@cli.command()
-@click.option('--id', 'card_id', required=True, type=int, help='Card ID to track')
-@click.pass_context
 def track(ctx, card_id: int):
     """Add a card to tracking database."""
-    config = ctx.obj['config']
-    db = ctx.obj['db']
+    from .api.sportscardspro import APIError
+    from .database.operations import CardOperations
+    from .tracker.price_tracker import PriceTracker
+
+    config = ctx['config']
+    db = ctx['db']
     
     try:
         api = get_api_client(config)
         tracker = PriceTracker(db, api)
         
-        click.echo(f"Tracking card ID: {card_id}")
+        print(f"Tracking card ID: {card_id}")
         
         if tracker.track_card(card_id):
-            click.echo("✓ Card added to tracking database")
+            print("✓ Card added to tracking database")
             
             # Show card info
             card_ops = CardOperations(db)
             card = card_ops.get_card(card_id)
             
             if card:
-                click.echo(f"\nCard: {card['product_name']}")
-                click.echo(f"Set: {card['console_name']}")
-                click.echo(f"Genre: {card['genre']}")
+                print(f"\nCard: {card['product_name']}")
+                print(f"Set: {card['console_name']}")
+                print(f"Genre: {card['genre']}")
         else:
-            click.echo("✗ Failed to track card", err=True)
+            print("✗ Failed to track card", file=sys.stderr)
             
     except APIError as e:
-        click.echo(f"API Error: {str(e)}", err=True)
+        print(f"API Error: {str(e)}", file=sys.stderr)
     except Exception as e:
-        click.echo(f"Error: {str(e)}", err=True)
+        print(f"Error: {str(e)}", file=sys.stderr)
 
 
-@cli.command()
-@click.option('--id', 'card_id', required=True, type=int, help='Card ID')
-@click.option('--price', required=True, type=float, help='Purchase price in dollars')
-@click.option('--condition', required=True, help='Card condition (e.g., ungraded, psa-10)')
-@click.option('--quantity', default=1, help='Quantity purchased')
-@click.option('--notes', default='', help='Additional notes')
-@click.pass_context
 def add_inventory(ctx, card_id: int, price: float, condition: str, quantity: int, notes: str):
     """Add a card to inventory."""
-    db = ctx.obj['db']
+    from .database.operations import CardOperations, InventoryOperations
+
+    db = ctx['db']
     
     try:
         inv_ops = InventoryOperations(db)
@@ -167,11 +247,11 @@ def add_inventory(ctx, card_id: int, price: float, condition: str, quantity: int
         # Check if card exists
         card = card_ops.get_card(card_id)
         if not card:
-            click.echo(f"Error: Card ID {card_id} not found. Please track it first.", err=True)
+            print(f"Error: Card ID {card_id} not found. Please track it first.", file=sys.stderr)
             return
         
         # Convert price to cents
-        price_cents = int(price * 100)
+        price_cents = _to_cents(price)
         cost_basis = price_cents * quantity
         
         # Add to inventory
@@ -187,27 +267,24 @@ def add_inventory(ctx, card_id: int, price: float, condition: str, quantity: int
         
         inv_id = inv_ops.add_inventory_item(inventory_data)
         
-        click.echo(f"✓ Added to inventory (ID: {inv_id})")
-        click.echo(f"Card: {card['product_name']}")
-        click.echo(f"Condition: {condition}")
-        click.echo(f"Quantity: {quantity}")
-        click.echo(f"Cost: ${price:.2f} each (${cost_basis/100:.2f} total)")
+        print(f"✓ Added to inventory (ID: {inv_id})")
+        print(f"Card: {card['product_name']}")
+        print(f"Condition: {condition}")
+        print(f"Quantity: {quantity}")
+        print(f"Cost: ${price:.2f} each (${cost_basis/100:.2f} total)")
         
     except Exception as e:
-        click.echo(f"Error: {str(e)}", err=True)
+        print(f"Error: {str(e)}", file=sys.stderr)
 
 
-@cli.command()
-@click.option('--sport', help='Filter by sport/genre')
-@click.option('--min-roi', type=float, help='Minimum ROI percentage')
-@click.option('--min-price', type=float, help='Minimum price in dollars')
-@click.option('--max-price', type=float, help='Maximum price in dollars')
-@click.pass_context
 def find_deals(ctx, sport: Optional[str], min_roi: Optional[float], 
                min_price: Optional[float], max_price: Optional[float]):
     """Find profitable card deals."""
-    config = ctx.obj['config']
-    db = ctx.obj['db']
+    from tabulate import tabulate
+    from .tracker.deal_finder import DealFinder
+
+    config = ctx['config']
+    db = ctx['db']
     
     try:
         calculator = get_calculator(config)
@@ -218,24 +295,25 @@ def find_deals(ctx, sport: Optional[str], min_roi: Optional[float],
         # Convert price range to cents
         price_range = None
         if min_price or max_price:
-            min_cents = int(min_price * 100) if min_price else 0
-            max_cents = int(max_price * 100) if max_price else 999999999
+            min_cents = _to_cents(min_price) if min_price else 0
+            max_cents = _to_cents(max_price) if max_price else 999999999
             price_range = (min_cents, max_cents)
         
-        click.echo("Searching for deals...")
+        print("Searching for deals...")
         deals = deal_finder.find_deals(
             sport=sport,
             min_roi=min_roi,
-            price_range=price_range
+            price_range=price_range,
+            limit=20
         )
         
         if not deals:
-            click.echo("No deals found matching criteria.")
+            print("No deals found matching criteria.")
             return
         
         # Display deals
         table_data = []
-        for deal in deals[:20]:  # Show top 20
+        for deal in deals:
             table_data.append([
                 deal['card_id'],
                 deal['product_name'][:40],
@@ -246,51 +324,45 @@ def find_deals(ctx, sport: Optional[str], min_roi: Optional[float],
                 f"{deal['roi_percent']:.1f}%"
             ])
         
-        headers = ['ID', 'Card', 'Market', 'Buy At', 'Trend', 'Profit', 'ROI']
-        click.echo(tabulate(table_data, headers=headers, tablefmt='grid'))
-        click.echo(f"\nFound {len(deals)} potential deals")
+        print(tabulate(table_data, headers=_DEAL_HEADERS, tablefmt='simple'))
+        print(f"\nShowing the top {len(deals)} potential deals")
         
     except Exception as e:
-        click.echo(f"Error: {str(e)}", err=True)
+        print(f"Error: {str(e)}", file=sys.stderr)
 
 
-@cli.command()
-@click.option('--purchase-price', required=True, type=float, help='Purchase price in dollars')
-@click.option('--market-value', required=True, type=float, help='Market value in dollars')
-@click.option('--shipping', type=float, help='Shipping cost in dollars')
-@click.pass_context
 def calc_profit(ctx, purchase_price: float, market_value: float, shipping: Optional[float]):
     """Calculate potential profit for a purchase."""
-    config = ctx.obj['config']
+    config = ctx['config']
     calculator = get_calculator(config)
     
     # Convert to cents
-    purchase_cents = int(purchase_price * 100)
-    market_cents = int(market_value * 100)
-    shipping_cents = int(shipping * 100) if shipping else None
+    purchase_cents = _to_cents(purchase_price)
+    market_cents = _to_cents(market_value)
+    shipping_cents = _to_cents(shipping) if shipping else None
     
     result = calculator.calculate_profit(purchase_cents, market_cents, shipping_cents)
     
-    click.echo("\n=== Profit Calculation ===")
-    click.echo(f"Purchase Price:  {calculator.format_currency(result['purchase_price'])}")
-    click.echo(f"Market Value:    {calculator.format_currency(result['market_value'])}")
-    click.echo(f"Shipping Cost:   {calculator.format_currency(result['shipping_cost'])}")
-    click.echo(f"eBay Fees:       {calculator.format_currency(result['ebay_fees'])}")
-    click.echo(f"─────────────────────────")
-    click.echo(f"Gross Profit:    {calculator.format_currency(result['gross_profit'])}")
-    click.echo(f"Total Costs:     {calculator.format_currency(result['total_costs'])}")
-    click.echo(f"Net Profit:      {calculator.format_currency(result['net_profit'])}")
-    click.echo(f"ROI:             {result['roi_percent']:.2f}%")
-    click.echo()
-
-
-@cli.command()
-@click.option('--status', type=click.Choice(['all', 'available', 'sold']), default='all',
-              help='Filter by status')
-@click.pass_context
-def inventory(ctx, status: str):
+    print("\n=== Profit Calculation ===")
+    print(f"Purchase Price:  {calculator.format_currency(result['purchase_price'])}")
+    print(f"Market Value:    {calculator.format_currency(result['market_value'])}")
+    print(f"Shipping Cost:   {calculator.format_currency(result['shipping_cost'])}")
+    print(f"eBay Fees:       {calculator.format_currency(result['ebay_fees'])}")
+    print(f"─────────────────────────")
+    print(f"Gross Profit:    {calculator.format_currency(result['gross_profit'])}")
+    print(f"Total Costs:     {calculator.format_currency(result['total_costs'])}")
+    print(f"Net Profit:      {calculator.format_currency(result['net_profit'])}")
+    print(f"ROI:             {result['roi_percent']:.2f}%")
+    print()
+
+
+def inventory(ctx, status: str, limit: Optional[int], offset: int):
     """View inventory items."""
-    db = ctx.obj['db']
+    from tabulate import tabulate
+    from .calculator.profit_calculator import ProfitCalculator
+    from .database.operations import InventoryOperations
+
+    db = ctx['db']
     
     try:
         inv_ops = InventoryOperations(db)
@@ -301,19 +373,19 @@ def inventory(ctx, status: str):
         elif status == 'sold':
             sold_filter = True
         
-        items = inv_ops.get_inventory(sold=sold_filter)
+        items = inv_ops.get_inventory(sold=sold_filter, limit=limit, offset=offset)
         
         if not items:
-            click.echo(f"No {status} inventory items.")
+            print(f"No {status} inventory items.")
             return
         
         # Display inventory
         table_data = []
-        calculator = ProfitCalculator()
+        format_currency = ProfitCalculator.format_currency
         
         for item in items:
             status_icon = "✓" if item['sold'] else "○"
-            profit = calculator.format_currency(item['net_profit']) if item['sold'] else '-'
+            profit = format_currency(item['net_profit']) if item['sold'] else '-'
             
             table_data.append([
                 status_icon,
@@ -321,30 +393,26 @@ def inventory(ctx, status: str):
                 item['product_name'][:40],
                 item['condition'],
                 item['quantity'],
-                calculator.format_currency(item['purchase_price']),
+                format_currency(item['purchase_price']),
                 item['purchase_date'],
                 profit
             ])
         
-        headers = ['', 'ID', 'Card', 'Condition', 'Qty', 'Cost', 'Date', 'Profit']
-        click.echo(tabulate(table_data, headers=headers, tablefmt='grid'))
-        click.echo(f"\nTotal items: {len(items)}")
+        print(tabulate(table_data, headers=_INVENTORY_HEADERS, tablefmt='simple'))
+        label = "Items shown" if limit is not None or offset else "Total items"
+        print(f"\n{label}: {len(items)}")
         
     except Exception as e:
-        click.echo(f"Error: {str(e)}", err=True)
+        print(f"Error: {str(e)}", file=sys.stderr)
 
 
-@cli.command()
-@click.option('--inventory-id', required=True, type=int, help='Inventory item ID')
-@click.option('--sold-price', required=True, type=float, help='Sale price in dollars')
-@click.option('--date', help='Sale date (YYYY-MM-DD, default: today)')
-@click.option('--shipping', type=float, help='Actual shipping cost in dollars')
-@click.pass_context
 def record_sale(ctx, inventory_id: int, sold_price: float, date: Optional[str], 
                 shipping: Optional[float]):
     """Record a sale for an inventory item."""
-    config = ctx.obj['config']
-    db = ctx.obj['db']
+    from .database.operations import InventoryOperations
+
+    config = ctx['config']
+    db = ctx['db']
     
     try:
         inv_ops = InventoryOperations(db)
@@ -353,15 +421,15 @@ def record_sale(ctx, inventory_id: int, sold_price: float, date: Optional[str],
         # Get inventory item
         item = inv_ops.get_inventory_item(inventory_id)
         if not item:
-            click.echo(f"Error: Inventory item {inventory_id} not found.", err=True)
+            print(f"Error: Inventory item {inventory_id} not found.", file=sys.stderr)
             return
         
         if item['sold']:
-            click.echo("Error: Item already marked as sold.", err=True)
+            print("Error: Item already marked as sold.", file=sys.stderr)
             return
         
         # Convert to cents
-        sold_cents = int(sold_price * 100)
+        sold_cents = _to_cents(sold_price)
         
         # Calculate eBay fees
         ebay_fees = calculator.calculate_ebay_fees(sold_cents)
@@ -372,34 +440,34 @@ def record_sale(ctx, inventory_id: int, sold_price: float, date: Optional[str],
         # Record the sale
         if inv_ops.record_sale(inventory_id, sale_date, sold_cents, ebay_fees):
             # Calculate and display profit
-            shipping_cents = int(shipping * 100) if shipping else int(calculator.default_shipping_cost * 100)
+            shipping_cents = _to_cents(shipping) if shipping else _to_cents(calculator.default_shipping_cost)
             net_profit = sold_cents - item['cost_basis'] - ebay_fees - shipping_cents
             
-            click.echo("✓ Sale recorded successfully")
-            click.echo(f"\nSold Price:      {calculator.format_currency(sold_cents)}")
-            click.echo(f"Cost Basis:      {calculator.format_currency(item['cost_basis'])}")
-            click.echo(f"eBay Fees:       {calculator.format_currency(ebay_fees)}")
-            click.echo(f"Shipping:        {calculator.format_currency(shipping_cents)}")
-            click.echo(f"─────────────────────────")
-            click.echo(f"Net Profit:      {calculator.format_currency(net_profit)}")
+            print("✓ Sale recorded successfully")
+            print(f"\nSold Price:      {calculator.format_currency(sold_cents)}")
+            print(f"Cost Basis:      {calculator.format_currency(item['cost_basis'])}")
+            print(f"eBay Fees:       {calculator.format_currency(ebay_fees)}")
+            print(f"Shipping:        {calculator.format_currency(shipping_cents)}")
+            print(f"─────────────────────────")
+            print(f"Net Profit:      {calculator.format_currency(net_profit)}")
             
             if item['cost_basis'] > 0:
                 roi = (net_profit / item['cost_basis']) * 100
-                click.echo(f"ROI:             {roi:.2f}%")
+                print(f"ROI:             {roi:.2f}%")
         else:
-            click.echo("✗ Failed to record sale", err=True)
+            print("✗ Failed to record sale", file=sys.stderr)
             
     except Exception as e:
-        click.echo(f"Error: {str(e)}", err=True)
+        print(f"Error: {str(e)}", file=sys.stderr)
 
 
-@cli.command()
-@click.option('--month', required=True, help='Month in format YYYY-MM')
-@click.pass_context
 def report(ctx, month: str):
     """Generate monthly sales report."""
-    config = ctx.obj['config']
-    db = ctx.obj['db']
+    from .calculator.profit_calculator import ProfitCalculator
+    from .database.operations import InventoryOperations
+
+    config = ctx['config']
+    db = ctx['db']
     
     try:
         # Parse month
@@ -410,61 +478,153 @@ def report(ctx, month: str):
         calculator = ProfitCalculator()
         
         # Get goal from config
-        goal = config.get('goals', {}).get('march_2026_target', 100.0) * 100  # Convert to cents
+        goal = _to_cents(config.get('goals', {}).get('march_2026_target', 100.0))
         
-        click.echo(f"\n=== Monthly Report: {month} ===\n")
-        click.echo(f"Total Sales:     {report_data['total_sales']}")
-        click.echo(f"Revenue:         {calculator.format_currency(report_data['total_revenue'])}")
-        click.echo(f"Cost:            {calculator.format_currency(report_data['total_cost'])}")
-        click.echo(f"eBay Fees:       {calculator.format_currency(report_data['total_fees'])}")
-        click.echo(f"─────────────────────────")
-        click.echo(f"Net Profit:      {calculator.format_currency(report_data['total_profit'])}")
-        click.echo(f"Goal:            {calculator.format_currency(int(goal))}")
+        print(f"\n=== Monthly Report: {month} ===\n")
+        print(f"Total Sales:     {report_data['total_sales']}")
+        print(f"Revenue:         {calculator.format_currency(report_data['total_revenue'])}")
+        print(f"Cost:            {calculator.format_currency(report_data['total_cost'])}")
+        print(f"eBay Fees:       {calculator.format_currency(report_data['total_fees'])}")
+        print(f"─────────────────────────")
+        print(f"Net Profit:      {calculator.format_currency(report_data['total_profit'])}")
+        print(f"Goal:            {calculator.format_currency(goal)}")
         
         if goal > 0:
             progress = (report_data['total_profit'] / goal) * 100
-            click.echo(f"Progress:        {progress:.1f}%")
+            print(f"Progress:        {progress:.1f}%")
             
             if progress >= 100:
-                click.echo("\n🎉 Goal achieved!")
+                print("\n🎉 Goal achieved!")
             else:
                 remaining = goal - report_data['total_profit']
-                click.echo(f"Remaining:       {calculator.format_currency(int(remaining))}")
+                print(f"Remaining:       {calculator.format_currency(remaining)}")
         
-        click.echo()
+        print()
         
     except ValueError:
-        click.echo("Error: Invalid month format. Use YYYY-MM (e.g., 2026-03)", err=True)
+        print("Error: Invalid month format. Use YYYY-MM (e.g., 2026-03)", file=sys.stderr)
     except Exception as e:
-        click.echo(f"Error: {str(e)}", err=True)
+        print(f"Error: {str(e)}", file=sys.stderr)
 
 
-@cli.command()
-@click.pass_context
 def update_prices(ctx):
     """Update prices for all tracked cards."""
-    config = ctx.obj['config']
-    db = ctx.obj['db']
+    from .api.sportscardspro import APIError
+    from .tracker.price_tracker import PriceTracker
+
+    config = ctx['config']
+    db = ctx['db']
     
     try:
         api = get_api_client(config)
         tracker = PriceTracker(db, api)
         
-        click.echo("Updating prices for all tracked cards...")
+        print("Updating prices for all tracked cards...")
         
         result = tracker.update_all_prices()
         
-        click.echo(f"\n✓ Update complete")
-        click.echo(f"Total cards: {result['total']}")
-        click.echo(f"Successful: {result['successful']}")
-        click.echo(f"Failed: {result['failed']}")
-        click.echo(f"Timestamp: {result['timestamp']}")
+        print(f"\n✓ Update complete")
+        print(f"Total cards: {result['total']}")
+        print(f"Successful: {result['successful']}")
+        print(f"Failed: {result['failed']}")
+        print(f"Timestamp: {result['timestamp']}")
         
     except APIError as e:
-        click.echo(f"API Error: {str(e)}", err=True)
+        print(f"API Error: {str(e)}", file=sys.stderr)
     except Exception as e:
-        click.echo(f"Error: {str(e)}", err=True)
+        print(f"Error: {str(e)}", file=sys.stderr)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser with one subcommand per CLI command."""
+    parser = argparse.ArgumentParser(
+        prog='sportscards',
+        description='Sports Card Price Tracker - Track prices and find profitable deals.'
+    )
+    commands = parser.add_subparsers(dest='command', metavar='COMMAND')
+
+    cmd = commands.add_parser('search', help='Search for cards by name or player.')
+    cmd.add_argument('query')
+    cmd.add_argument('--limit', type=int, default=10, help='Maximum number of results')
+    cmd.set_defaults(func=search)
+
+    cmd = commands.add_parser('track', help='Add a card to tracking database.')
+    cmd.add_argument('--id', dest='card_id', required=True, type=int, help='Card ID to track')
+    cmd.set_defaults(func=track)
+
+    cmd = commands.add_parser('add-inventory', help='Add a card to inventory.')
+    cmd.add_argument('--id', dest='card_id', required=True, type=int, help='Card ID')
+    cmd.add_argument('--price', required=True, type=float, help='Purchase price in dollars')
+    cmd.add_argument('--condition', required=True, help='Card condition (e.g., ungraded, psa-10)')
+    cmd.add_argument('--quantity', type=int, default=1, help='Quantity purchased')
+    cmd.add_argument('--notes', default='', help='Additional notes')
+    cmd.set_defaults(func=add_inventory)
+
+    cmd = commands.add_parser('find-deals', help='Find profitable card deals.')
+    cmd.add_argument('--sport', help='Filter by sport/genre')
+    cmd.add_argument('--min-roi', type=float, help='Minimum ROI percentage')
+    cmd.add_argument('--min-price', type=float, help='Minimum price in dollars')
+    cmd.add_argument('--max-price', type=float, help='Maximum price in dollars')
+    cmd.set_defaults(func=find_deals)
+
+    cmd = commands.add_parser('calc-profit', help='Calculate potential profit for a purchase.')
+    cmd.add_argument('--purchase-price', required=True, type=float, help='Purchase price in dollars')
+    cmd.add_argument('--market-value', required=True, type=float, help='Market value in dollars')
+    cmd.add_argument('--shipping', type=float, help='Shipping cost in dollars')
+    cmd.set_defaults(func=calc_profit)
+
+    cmd = commands.add_parser('inventory', help='View inventory items.')
+    cmd.add_argument('--status', choices=['all', 'available', 'sold'], default='all',
+                     help='Filter by status')
+    cmd.add_argument('--limit', type=int, help='Maximum number of items to show')
+    cmd.add_argument('--offset', type=int, default=0, help='Number of items to skip')
+    cmd.set_defaults(func=inventory)
+
+    cmd = commands.add_parser('record-sale', help='Record a sale for an inventory item.')
+    cmd.add_argument('--inventory-id', required=True, type=int, help='Inventory item ID')
+    cmd.add_argument('--sold-price', required=True, type=float, help='Sale price in dollars')
+    cmd.add_argument('--date', help='Sale date (YYYY-MM-DD, default: today)')
+    cmd.add_argument('--shipping', type=float, help='Actual shipping cost in dollars')
+    cmd.set_defaults(func=record_sale)
+
+    cmd = commands.add_parser('report', help='Generate monthly sales report.')
+    cmd.add_argument('--month', required=True, help='Month in format YYYY-MM')
+    cmd.set_defaults(func=report)
+
+    cmd = commands.add_parser('update-prices', help='Update prices for all tracked cards.')
+    cmd.set_defaults(func=update_prices)
+
+    return parser
+
+
+def cli(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the CLI.
+
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:])
+
+    Returns:
+        Process exit code
+    """
+    parser = build_parser()
+    args = vars(parser.parse_args(argv))
+
+    command = args.pop('func', None)
+    args.pop('command')
+    if command is None:
+        parser.print_help()
+        return 0
+
+    ctx = create_context()
+    try:
+        command(ctx, **args)
+    finally:
+        if 'db' in ctx:
+            # Closing checkpoints the write-ahead log back into the database file
+            ctx['db'].close()
+    return 0
 
 
 if __name__ == '__main__':
-    cli(obj={})
+    sys.exit(cli())
@@ -5,10 +5,120 @@ This module provides CRUD operations for the sports card tracker database.
 """
 
 import sqlite3
+from itertools import chain
+from operator import itemgetter
 from datetime import datetime, date
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Any, Tuple
 from .models import Database
 
+# Price fields stored with each price_history snapshot, in column order
+SNAPSHOT_FIELDS = (
+    'loose_price', 'psa_10_price', 'grade_9_price', 'grade_8_price',
+    'bgs_10_price', 'cgc_10_price', 'sgc_10_price', 'sales_volume'
+)
+
+_SNAPSHOT_DEFAULTS = dict.fromkeys(SNAPSHOT_FIELDS, 0)
+_snapshot_getter = itemgetter(*SNAPSHOT_FIELDS)
+
+
+def _snapshot_values(price_data: Dict[str, int]) -> Tuple[int, ...]:
+    """
+    Extract the snapshot price fields from parsed card data, in column order.
+
+    Parsed API data carries every field, so one itemgetter call covers the
+    common case; missing fields default to 0.
+
+    Args:
+        price_data: Dictionary containing price information
+
+    Returns:
+        Tuple of values for SNAPSHOT_FIELDS
+    """
+    try:
+        return _snapshot_getter(price_data)
+    except KeyError:
+        return _snapshot_getter({**_SNAPSHOT_DEFAULTS, **price_data})
+
+
+# Statements for the write paths. sqlite3 keeps the prepared statement for
+# each distinct SQL string in the connection's statement cache.
+_UPSERT_CARD_SQL = """
+    INSERT OR REPLACE INTO cards 
+    (id, product_name, console_name, genre, release_date, first_tracked, last_updated)
+    VALUES (?, ?, ?, ?, ?, COALESCE((SELECT first_tracked FROM cards WHERE id = ?), CURRENT_TIMESTAMP), CURRENT_TIMESTAMP)
+"""
+
+_INSERT_INVENTORY_SQL = """
+    INSERT INTO inventory 
+    (card_id, purchase_date, purchase_price, condition, quantity, cost_basis, notes)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_SNAPSHOT_SQL = """
+    INSERT INTO price_history 
+    (card_id, loose_price, psa_10_price, grade_9_price, grade_8_price, 
+     bgs_10_price, cgc_10_price, sgc_10_price, sales_volume)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Rows per multi-row INSERT; 100 rows x 9 columns stays under SQLite's
+# historical limit of 999 bound parameters
+_SNAPSHOT_CHUNK = 100
+_INSERT_SNAPSHOT_CHUNK_SQL = _INSERT_SNAPSHOT_SQL.replace(
+    "(?, ?, ?, ?, ?, ?, ?, ?, ?)",
+    ", ".join(["(?, ?, ?, ?, ?, ?, ?, ?, ?)"] * _SNAPSHOT_CHUNK)
+)
+
+
+# Per-card loose price trend over the last ? days: the newest and oldest
+# snapshot in the window and the percentage change between them, for cards
+# with at least two snapshots and a nonzero starting price. Ties on
+# timestamp are broken by id so the latest insert wins. trend_percent is
+# left unrounded: SQLite's ROUND does not always agree with Python's
+# round(), so callers round it in Python as get_price_trend does.
+_PRICE_TRENDS_CTE_TEMPLATE = """
+    WITH windowed AS (
+        SELECT
+            card_id,
+            ROW_NUMBER() OVER w AS rn,
+            COUNT(*) OVER w AS snapshots,
+            FIRST_VALUE(loose_price) OVER w AS latest_price,
+            LAST_VALUE(loose_price) OVER w AS oldest_price
+        FROM price_history
+        WHERE timestamp >= datetime('now', '-' || ? || ' days')
+        {card_filter}
+        WINDOW w AS (
+            PARTITION BY card_id ORDER BY timestamp DESC, id DESC
+            ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
+        )
+    ),
+    trends AS (
+        SELECT
+            card_id,
+            latest_price,
+            (latest_price - oldest_price) * 1.0 / oldest_price * 100 AS trend_percent
+        FROM windowed
+        WHERE rn = 1 AND snapshots >= 2 AND oldest_price != 0
+    )
+"""
+
+PRICE_TRENDS_CTE = _PRICE_TRENDS_CTE_TEMPLATE.format(card_filter="")
+
+# Rounding to 2 places moves a trend by at most 0.005, so a SQL prefilter on
+# the unrounded trend widened by this much keeps every card whose rounded
+# trend passes the exact check in Python
+TREND_ROUNDING_SLACK = 0.01
+
+# The same trends restricted to cards updated in the last ? days, so stale
+# cards' history is never windowed
+_RECENT_PRICE_TRENDS_CTE = _PRICE_TRENDS_CTE_TEMPLATE.format(card_filter=(
+    "AND card_id IN (SELECT id FROM cards "
+    "WHERE last_updated >= datetime('now', '-' || ? || ' days'))"
+))
+
+# Entries kept by PriceHistoryOperations' lookup cache before it starts over
+_LOOKUP_CACHE_SIZE = 1024
+
 
 class CardOperations:
     """Operations for managing cards in the database."""
@@ -35,11 +145,7 @@ class CardOperations:
         conn = self.db.connect()
         cursor = conn.cursor()
 
-        cursor.execute("""
-            INSERT OR REPLACE INTO cards 
-            (id, product_name, console_name, genre, release_date, first_tracked, last_updated)
-            VALUES (?, ?, ?, ?, ?, COALESCE((SELECT first_tracked FROM cards WHERE id = ?), CURRENT_TIMESTAMP), CURRENT_TIMESTAMP)
-        """, (
+        cursor.execute(_UPSERT_CARD_SQL, (
             card_data['id'],
             card_data['product_name'],
             card_data.get('console_name', ''),
@@ -78,13 +184,45 @@ class CardOperations:
         Returns:
             List of card data dictionaries
         """
+        return list(self.iter_all_cards())
+
+    def iter_all_cards(self, batch_size: int = 1024) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all tracked cards without loading them all at once.
+
+        Rows are fetched batch_size at a time, so memory stays flat however
+        many cards are tracked.
+
+        Args:
+            batch_size: Rows fetched from SQLite per batch (default: 1024)
+
+        Yields:
+            Card data dictionaries, most recently updated first
+        """
         conn = self.db.connect()
         cursor = conn.cursor()
 
         cursor.execute("SELECT * FROM cards ORDER BY last_updated DESC")
-        rows = cursor.fetchall()
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for row in rows:
+                yield dict(row)
 
-        return [dict(row) for row in rows]
+    def get_all_card_ids(self) -> List[int]:
+        """
+        Get the IDs of all tracked cards.
+
+        Cheaper than get_all_cards for callers that only need IDs, since no
+        row dicts are built.
+
+        Returns:
+            Card IDs, most recently updated first
+        """
+        conn = self.db.connect()
+        cursor = conn.execute("SELECT id FROM cards ORDER BY last_updated DESC")
+        return [row[0] for row in cursor]
 
     def update_card_timestamp(self, card_id: int):
         """
@@ -102,6 +240,17 @@ class CardOperations:
 
         conn.commit()
 
+    def update_card_timestamps(self, card_ids: Iterable[int]):
+        """
+        Update the last_updated timestamp for many cards in one transaction.
+
+        Args:
+            card_ids: Card IDs
+        """
+        self.db.executemany("""
+            UPDATE cards SET last_updated = CURRENT_TIMESTAMP WHERE id = ?
+        """, [(card_id,) for card_id in card_ids])
+
 
 class PriceHistoryOperations:
     """Operations for managing price history."""
@@ -115,6 +264,41 @@ class PriceHistoryOperations:
         """
         self.db = db
 
+        # Latest-price and trend lookups, valid while the connection's
+        # total_changes counter is unchanged (i.e. until any write)
+        self._cache: Dict[Tuple, Any] = {}
+        self._cache_stamp = -1
+
+    def clear_cache(self):
+        """Discard cached latest-price and trend lookups."""
+        self._cache.clear()
+        self._cache_stamp = -1
+
+    def _cached(self, key: Tuple, compute: Callable[[], Any]) -> Any:
+        """
+        Return a cached lookup, computing it on a miss.
+
+        Any write on the shared connection since the last lookup clears the
+        cache, so results never outlive the data they were read from.
+
+        Args:
+            key: Cache key
+            compute: Function producing the value on a miss
+
+        Returns:
+            Cached or freshly computed value
+        """
+        stamp = self.db.connect().total_changes
+        if stamp != self._cache_stamp or len(self._cache) >= _LOOKUP_CACHE_SIZE:
+            self._cache.clear()
+            self._cache_stamp = stamp
+
+        try:
+            return self._cache[key]
+        except KeyError:
+            value = self._cache[key] = compute()
+            return value
+
     def add_price_snapshot(self, card_id: int, price_data: Dict[str, int]):
         """
         Add a price snapshot to history.
@@ -123,27 +307,34 @@ class PriceHistoryOperations:
             card_id: Card ID
             price_data: Dictionary containing price information
         """
-        conn = self.db.connect()
-        cursor = conn.cursor()
+        self.add_price_snapshots([(card_id, price_data)])
 
-        cursor.execute("""
-            INSERT INTO price_history 
-            (card_id, loose_price, psa_10_price, grade_9_price, grade_8_price, 
-             bgs_10_price, cgc_10_price, sgc_10_price, sales_volume)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            card_id,
-            price_data.get('loose_price', 0),
-            price_data.get('psa_10_price', 0),
-            price_data.get('grade_9_price', 0),
-            price_data.get('grade_8_price', 0),
-            price_data.get('bgs_10_price', 0),
-            price_data.get('cgc_10_price', 0),
-            price_data.get('sgc_10_price', 0),
-            price_data.get('sales_volume', 0)
-        ))
+    def add_price_snapshots(self, snapshots: Iterable[Tuple[int, Dict[str, int]]]) -> int:
+        """
+        Add many price snapshots to history in a single transaction.
 
-        conn.commit()
+        Args:
+            snapshots: (card_id, price_data) pairs
+
+        Returns:
+            Number of snapshots written
+        """
+        rows = [(card_id,) + _snapshot_values(price_data) for card_id, price_data in snapshots]
+        if not rows:
+            return 0
+
+        # Full chunks go through one multi-row INSERT each, the tail through
+        # the single-row statement
+        full = len(rows) - len(rows) % _SNAPSHOT_CHUNK
+
+        with self.db.transaction() as conn:
+            for start in range(0, full, _SNAPSHOT_CHUNK):
+                chunk = rows[start:start + _SNAPSHOT_CHUNK]
+                conn.execute(_INSERT_SNAPSHOT_CHUNK_SQL, list(chain.from_iterable(chunk)))
+            if full < len(rows):
+                conn.executemany(_INSERT_SNAPSHOT_SQL, rows[full:])
+
+        return len(rows)
 
     def get_price_history(self, card_id: int, days: int = 30) -> List[Dict[str, Any]]:
         """
@@ -179,13 +370,18 @@ class PriceHistoryOperations:
         Returns:
             Latest price data or None if no history exists
         """
+        latest = self._cached(('latest', card_id), lambda: self._fetch_latest_price(card_id))
+        return dict(latest) if latest else None
+
+    def _fetch_latest_price(self, card_id: int) -> Optional[Dict[str, Any]]:
+        """Query the most recent price snapshot for a card."""
         conn = self.db.connect()
         cursor = conn.cursor()
 
         cursor.execute("""
             SELECT * FROM price_history 
             WHERE card_id = ? 
-            ORDER BY timestamp DESC 
+            ORDER BY timestamp DESC, id DESC
             LIMIT 1
         """, (card_id,))
 
@@ -204,21 +400,100 @@ class PriceHistoryOperations:
 
         Returns:
             Percentage change (positive for increase, negative for decrease) or None
+
+        Raises:
+            ValueError: If field is not a price_history price field
         """
-        history = self.get_price_history(card_id, days=30)
-        
-        if len(history) < 2:
-            return None
+        return self._cached(
+            ('trend', card_id, field), lambda: self._compute_price_trend(card_id, field)
+        )
 
-        oldest_price = history[-1].get(field, 0)
-        latest_price = history[0].get(field, 0)
+    def _compute_price_trend(self, card_id: int, field: str) -> Optional[float]:
+        """Compute the 30-day price trend for a card with a single-row query."""
+        if field not in SNAPSHOT_FIELDS:
+            raise ValueError(f"Unknown price field: {field}")
+
+        conn = self.db.connect()
+        cursor = conn.cursor()
 
-        if oldest_price == 0:
+        # field is whitelisted above, so it is safe to format into the SQL
+        cursor.execute(f"""
+            SELECT
+                COUNT(*) AS snapshots,
+                (SELECT {field} FROM price_history
+                 WHERE card_id = ? AND timestamp >= datetime('now', '-30 days')
+                 ORDER BY timestamp DESC, id DESC LIMIT 1) AS latest_price,
+                (SELECT {field} FROM price_history
+                 WHERE card_id = ? AND timestamp >= datetime('now', '-30 days')
+                 ORDER BY timestamp ASC, id ASC LIMIT 1) AS oldest_price
+            FROM price_history
+            WHERE card_id = ? AND timestamp >= datetime('now', '-30 days')
+        """, (card_id, card_id, card_id))
+
+        snapshots, latest_price, oldest_price = cursor.fetchone()
+        
+        if snapshots < 2 or not oldest_price:
             return None
 
         change_percent = ((latest_price - oldest_price) / oldest_price) * 100
         return round(change_percent, 2)
 
+    def get_price_changes(
+        self,
+        min_change_percent: float = 5.0,
+        days: int = 30,
+        updated_within_days: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get cards whose loose price moved more than a threshold.
+
+        Computes every card's trend in one windowed query rather than
+        querying the history of each card separately.
+
+        Args:
+            min_change_percent: Minimum absolute trend percentage (exclusive)
+            days: Trend window in days (default: 30, as in get_price_trend)
+            updated_within_days: Only consider cards whose last_updated falls
+                within this many days (None for all cards)
+
+        Returns:
+            List of cards with trend_percent and latest_price, largest
+            absolute change first
+        """
+        conn = self.db.connect()
+        cursor = conn.cursor()
+
+        if updated_within_days is None:
+            trends_cte = PRICE_TRENDS_CTE
+            params: List[Any] = [days]
+        else:
+            trends_cte = _RECENT_PRICE_TRENDS_CTE
+            params = [days, updated_within_days]
+
+        cursor.execute(trends_cte + """
+            SELECT
+                c.id AS card_id,
+                c.product_name,
+                c.console_name,
+                t.trend_percent,
+                t.latest_price
+            FROM trends t
+            JOIN cards c ON c.id = t.card_id
+            WHERE ABS(t.trend_percent) > ?
+            ORDER BY c.last_updated DESC
+        """, params + [min_change_percent - TREND_ROUNDING_SLACK])
+
+        changes = []
+        for row in cursor.fetchall():
+            change = dict(row)
+            change['trend_percent'] = trend = round(change['trend_percent'], 2)
+            if abs(trend) > min_change_percent:
+                changes.append(change)
+
+        # Stable, so equal trends stay most recently updated first
+        changes.sort(key=lambda change: abs(change['trend_percent']), reverse=True)
+        return changes
+
 
 class InventoryOperations:
     """Operations for managing inventory."""
@@ -245,11 +520,7 @@ class InventoryOperations:
         conn = self.db.connect()
         cursor = conn.cursor()
 
-        cursor.execute("""
-            INSERT INTO inventory 
-            (card_id, purchase_date, purchase_price, condition, quantity, cost_basis, notes)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (
+        cursor.execute(_INSERT_INVENTORY_SQL, (
             inventory_data['card_id'],
             inventory_data['purchase_date'],
             inventory_data['purchase_price'],
@@ -282,12 +553,19 @@ class InventoryOperations:
             return dict(row)
         return None
 
-    def get_inventory(self, sold: Optional[bool] = None) -> List[Dict[str, Any]]:
+    def get_inventory(
+        self,
+        sold: Optional[bool] = None,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[Dict[str, Any]]:
         """
         Get inventory items.
 
         Args:
             sold: Filter by sold status (None for all, True for sold, False for available)
+            limit: Maximum number of items to return (None for all)
+            offset: Number of items to skip, for paging with limit
 
         Returns:
             List of inventory items
@@ -295,21 +573,25 @@ class InventoryOperations:
         conn = self.db.connect()
         cursor = conn.cursor()
 
-        if sold is None:
-            cursor.execute("""
-                SELECT i.*, c.product_name, c.console_name 
-                FROM inventory i 
-                JOIN cards c ON i.card_id = c.id
-                ORDER BY i.purchase_date DESC
-            """)
-        else:
-            cursor.execute("""
-                SELECT i.*, c.product_name, c.console_name 
-                FROM inventory i 
-                JOIN cards c ON i.card_id = c.id
-                WHERE i.sold = ?
-                ORDER BY i.purchase_date DESC
-            """, (1 if sold else 0,))
+        query = """
+            SELECT i.*, c.product_name, c.console_name 
+            FROM inventory i 
+            JOIN cards c ON i.card_id = c.id
+        """
+        params: List[Any] = []
+
+        if sold is not None:
+            query += " WHERE i.sold = ?"
+            params.append(1 if sold else 0)
+
+        query += " ORDER BY i.purchase_date DESC"
+
+        if limit is not None or offset:
+            # SQLite needs a LIMIT to apply an OFFSET; -1 means no limit
+            query += " LIMIT ? OFFSET ?"
+            params.extend((-1 if limit is None else limit, offset))
+
+        cursor.execute(query, params)
 
         rows = cursor.fetchall()
         return [dict(row) for row in rows]
@@ -326,31 +608,34 @@ class InventoryOperations:
 
         Args:
             inventory_id: Inventory item ID
-            sold_date: Date of sale
+            sold_date: Date of sale as YYYY-MM-DD; month and day may be
+                unpadded (e.g. 2024-3-5) and are stored zero-padded
             sold_price: Sale price in cents
             ebay_fees: eBay fees in cents
 
         Returns:
             True if successful, False otherwise
+
+        Raises:
+            ValueError: If sold_date is not a valid date
         """
+        # The reports compare sold_date as text, which needs ISO dates
+        sold_date = datetime.strptime(sold_date, '%Y-%m-%d').date().isoformat()
+
         conn = self.db.connect()
         cursor = conn.cursor()
 
-        # Get the item to calculate profit
-        item = self.get_inventory_item(inventory_id)
-        if not item:
-            return False
-
-        net_profit = sold_price - item['cost_basis'] - ebay_fees
-
+        # Profit is computed from the stored cost basis in the same statement,
+        # and rowcount tells whether the item exists
         cursor.execute("""
             UPDATE inventory 
-            SET sold = 1, sold_date = ?, sold_price = ?, ebay_fees = ?, net_profit = ?
+            SET sold = 1, sold_date = ?, sold_price = ?, ebay_fees = ?,
+                net_profit = ? - cost_basis - ?
             WHERE id = ?
-        """, (sold_date, sold_price, ebay_fees, net_profit, inventory_id))
+        """, (sold_date, sold_price, ebay_fees, sold_price, ebay_fees, inventory_id))
 
         conn.commit()
-        return True
+        return cursor.rowcount > 0
 
     def get_monthly_report(self, year: int, month: int) -> Dict[str, Any]:
         """
@@ -363,6 +648,14 @@ class InventoryOperations:
         Returns:
             Dictionary with report data
         """
+        # Compare dates as a half-open range so the sold_date index is used,
+        # rather than running strftime on every sold row
+        month_start = f"{year:04d}-{month:02d}-01"
+        if month == 12:
+            month_end = f"{year + 1:04d}-01-01"
+        else:
+            month_end = f"{year:04d}-{month + 1:02d}-01"
+
         conn = self.db.connect()
         cursor = conn.cursor()
 
@@ -376,9 +669,9 @@ class InventoryOperations:
                 SUM(net_profit) as total_profit
             FROM inventory
             WHERE sold = 1
-            AND strftime('%Y', sold_date) = ?
-            AND strftime('%m', sold_date) = ?
-        """, (str(year), f"{month:02d}"))
+            AND sold_date >= ?
+            AND sold_date < ?
+        """, (month_start, month_end))
 
         row = cursor.fetchone()
         
@@ -389,3 +682,56 @@ class InventoryOperations:
             'total_fees': row['total_fees'] or 0,
             'total_profit': row['total_profit'] or 0
         }
+
+    def get_yearly_report(self, year: int) -> Dict[int, Dict[str, Any]]:
+        """
+        Generate monthly sales reports for a whole year in one query.
+
+        Args:
+            year: Year
+
+        Returns:
+            Mapping of month (1-12) to report data in the same form as
+            get_monthly_report; months without sales report zeros
+        """
+        conn = self.db.connect()
+        cursor = conn.cursor()
+
+        # The same sargable range as get_monthly_report, grouped by the month
+        # digits of the ISO date
+        cursor.execute("""
+            SELECT 
+                CAST(substr(sold_date, 6, 2) AS INTEGER) as month,
+                COUNT(*) as total_sales,
+                SUM(sold_price) as total_revenue,
+                SUM(cost_basis) as total_cost,
+                SUM(ebay_fees) as total_fees,
+                SUM(net_profit) as total_profit
+            FROM inventory
+            WHERE sold = 1
+            AND sold_date >= ?
+            AND sold_date < ?
+            GROUP BY month
+        """, (f"{year:04d}-01-01", f"{year + 1:04d}-01-01"))
+
+        report = {
+            month: {
+                'total_sales': 0,
+                'total_revenue': 0,
+                'total_cost': 0,
+                'total_fees': 0,
+                'total_profit': 0
+            }
+            for month in range(1, 13)
+        }
+        for row in cursor.fetchall():
+            if row['month'] in report:
+                report[row['month']] = {
+                    'total_sales': row['total_sales'],
+                    'total_revenue': row['total_revenue'] or 0,
+                    'total_cost': row['total_cost'] or 0,
+                    'total_fees': row['total_fees'] or 0,
+                    'total_profit': row['total_profit'] or 0
+                }
+
+        return report
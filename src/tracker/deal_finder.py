@@ -4,10 +4,28 @@ Deal Finder
 This module identifies profitable buying opportunities.
 """
 
+import heapq
 from typing import Dict, List, Any, Optional
-from database.models import Database
-from database.operations import PriceHistoryOperations
-from calculator.profit_calculator import ProfitCalculator
+
+import numpy as np
+
+from ..database.models import Database
+from ..database.operations import (
+    PRICE_TRENDS_CTE, TREND_ROUNDING_SLACK, PriceHistoryOperations
+)
+from ..calculator.profit_calculator import ProfitCalculator
+
+
+# Condition names reported by compare_conditions and their price fields
+_CONDITION_FIELDS = (
+    ('ungraded', 'loose_price'),
+    ('psa_10', 'psa_10_price'),
+    ('grade_9', 'grade_9_price'),
+    ('grade_8', 'grade_8_price'),
+    ('bgs_10', 'bgs_10_price'),
+    ('cgc_10', 'cgc_10_price'),
+    ('sgc_10', 'sgc_10_price')
+)
 
 
 class DealFinder:
@@ -36,7 +54,8 @@ class DealFinder:
         self,
         sport: Optional[str] = None,
         min_roi: Optional[float] = None,
-        price_range: Optional[tuple] = None
+        price_range: Optional[tuple] = None,
+        limit: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
         Find cards that are good buying opportunities.
@@ -45,29 +64,36 @@ class DealFinder:
             sport: Filter by sport/genre
             min_roi: Minimum ROI percentage (overrides default)
             price_range: Tuple of (min_price, max_price) in cents
+            limit: Maximum number of deals to return (None for all)
 
         Returns:
-            List of deal opportunities
+            List of deal opportunities, best ROI first
         """
         min_roi_threshold = min_roi if min_roi is not None else self.min_roi_percent
         
         conn = self.db.connect()
         cursor = conn.cursor()
 
-        # Build query
-        query = """
-            SELECT c.*, ph.loose_price, ph.psa_10_price, ph.grade_9_price
-            FROM cards c
-            JOIN price_history ph ON c.id = ph.card_id
-            WHERE ph.id IN (
-                SELECT id FROM price_history ph2 
-                WHERE ph2.card_id = c.id 
-                ORDER BY ph2.timestamp DESC 
-                LIMIT 1
+        # Build query: each card's latest snapshot joined to its 30-day trend,
+        # keeping only cards whose price dropped more than 5%
+        query = PRICE_TRENDS_CTE + """,
+            latest AS (
+                SELECT
+                    card_id, loose_price, psa_10_price, grade_9_price,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY card_id ORDER BY timestamp DESC, id DESC
+                    ) AS rn
+                FROM price_history
             )
+            SELECT c.*, l.loose_price, l.psa_10_price, l.grade_9_price, t.trend_percent
+            FROM cards c
+            JOIN latest l ON l.card_id = c.id AND l.rn = 1
+            JOIN trends t ON t.card_id = c.id
+            WHERE t.trend_percent < ?
+            AND l.loose_price != 0
         """
         
-        params = []
+        params = [30, -5 + TREND_ROUNDING_SLACK]
         
         if sport:
             query += " AND c.genre LIKE ?"
@@ -75,53 +101,55 @@ class DealFinder:
         
         if price_range:
             min_price, max_price = price_range
-            query += " AND ph.loose_price BETWEEN ? AND ?"
+            query += " AND l.loose_price BETWEEN ? AND ?"
             params.extend([min_price, max_price])
 
         cursor.execute(query, params)
-        rows = cursor.fetchall()
 
+        # Round trends as get_price_trend does before the exact check
+        rows = []
+        trends = []
+        for row in cursor.fetchall():
+            trend = round(row['trend_percent'], 2)
+            if trend < -5:
+                rows.append(row)
+                trends.append(trend)
+
+        if not rows:
+            return []
+
+        # Simulate a potential purchase at current market price
+        # (In real scenario, you'd compare with actual eBay listings)
+        # Assume you can buy at 85% of current market (15% discount)
+        market_prices = np.array([row['loose_price'] for row in rows], dtype=np.int64)
+        buy_prices = (market_prices * 0.85).astype(np.int64)
+
+        # Calculate potential profit for every candidate in one pass
+        profit_calc = self.calculator.calculate_profit_batch(buy_prices, market_prices)
+        net_profits = profit_calc['net_profit']
+        roi_percents = profit_calc['roi_percent']
+
+        # Only build result dicts for the cards that clear the ROI bar
         deals = []
-        for row in rows:
-            card_data = dict(row)
-            
-            # Simulate a potential purchase at current market price
-            market_price = card_data['loose_price']
-            
-            if market_price == 0:
-                continue
-            
-            # Look for cards where you could buy below market
-            # (In real scenario, you'd compare with actual eBay listings)
-            
-            # Get price trend
-            trend = self.price_ops.get_price_trend(card_data['id'])
-            
-            # If price is decreasing, it might be a good buy opportunity
-            if trend and trend < -5:  # Price dropped more than 5%
-                # Calculate potential profit
-                # Assume you can buy at 85% of current market (15% discount)
-                potential_purchase_price = int(market_price * 0.85)
-                
-                profit_calc = self.calculator.calculate_profit(
-                    potential_purchase_price,
-                    market_price
-                )
-                
-                if profit_calc['roi_percent'] >= min_roi_threshold:
-                    deals.append({
-                        'card_id': card_data['id'],
-                        'product_name': card_data['product_name'],
-                        'console_name': card_data['console_name'],
-                        'genre': card_data['genre'],
-                        'market_price': market_price,
-                        'potential_buy_price': potential_purchase_price,
-                        'price_trend': trend,
-                        'expected_profit': profit_calc['net_profit'],
-                        'roi_percent': profit_calc['roi_percent']
-                    })
+        append = deals.append
+        for i in np.flatnonzero(roi_percents >= min_roi_threshold).tolist():
+            row = rows[i]
+            append({
+                'card_id': row['id'],
+                'product_name': row['product_name'],
+                'console_name': row['console_name'],
+                'genre': row['genre'],
+                'market_price': int(market_prices[i]),
+                'potential_buy_price': int(buy_prices[i]),
+                'price_trend': trends[i],
+                'expected_profit': int(net_profits[i]),
+                'roi_percent': float(roi_percents[i])
+            })
 
         # Sort by ROI (descending)
+        if limit is not None:
+            # Same order as the full sort, without sorting the rest
+            return heapq.nlargest(limit, deals, key=lambda x: x['roi_percent'])
         deals.sort(key=lambda x: x['roi_percent'], reverse=True)
         
         return deals
@@ -161,12 +189,16 @@ class DealFinder:
             discount_percent = ((market_value_cents - asking_price_cents) / market_value_cents) * 100
         
         # Recommendation
+        roi = profit_calc['roi_percent']
+        min_roi = self.min_roi_percent
+        meets_minimum = roi >= min_roi
+
         recommendation = "PASS"
-        if profit_calc['roi_percent'] >= self.min_roi_percent * 1.5:
+        if roi >= min_roi * 1.5:
             recommendation = "STRONG BUY"
-        elif profit_calc['roi_percent'] >= self.min_roi_percent:
+        elif meets_minimum:
             recommendation = "BUY"
-        elif profit_calc['roi_percent'] >= self.min_roi_percent * 0.5:
+        elif roi >= min_roi * 0.5:
             recommendation = "MAYBE"
         
         return {
@@ -175,7 +207,7 @@ class DealFinder:
             'discount_percent': round(discount_percent, 2),
             'profit_calculation': profit_calc,
             'recommendation': recommendation,
-            'meets_minimum_roi': profit_calc['roi_percent'] >= self.min_roi_percent
+            'meets_minimum_roi': meets_minimum
         }
 
     def compare_conditions(self, card_id: int) -> Dict[str, Any]:
@@ -193,28 +225,28 @@ class DealFinder:
         if not latest_price:
             return {}
         
-        conditions = {
-            'ungraded': latest_price.get('loose_price', 0),
-            'psa_10': latest_price.get('psa_10_price', 0),
-            'grade_9': latest_price.get('grade_9_price', 0),
-            'grade_8': latest_price.get('grade_8_price', 0),
-            'bgs_10': latest_price.get('bgs_10_price', 0),
-            'cgc_10': latest_price.get('cgc_10_price', 0),
-            'sgc_10': latest_price.get('sgc_10_price', 0)
-        }
+        # Only conditions that have a market price are analyzed
+        priced = [
+            (condition, latest_price.get(field, 0)) for condition, field in _CONDITION_FIELDS
+            if latest_price.get(field, 0) > 0
+        ]
+        if not priced:
+            return {}
+
+        conditions = [condition for condition, _ in priced]
+        prices = np.array([price for _, price in priced], dtype=np.int64)
+
+        # Assume you can buy at 15% discount
+        buy_prices = (prices * 0.85).astype(np.int64)
+        profit_calc = self.calculator.calculate_profit_batch(buy_prices, prices)
         
         results = {}
-        for condition, price in conditions.items():
-            if price > 0:
-                # Assume you can buy at 15% discount
-                buy_price = int(price * 0.85)
-                profit_calc = self.calculator.calculate_profit(buy_price, price)
-                
-                results[condition] = {
-                    'market_value': price,
-                    'potential_buy_price': buy_price,
-                    'expected_profit': profit_calc['net_profit'],
-                    'roi_percent': profit_calc['roi_percent']
-                }
+        for i, condition in enumerate(conditions):
+            results[condition] = {
+                'market_value': int(prices[i]),
+                'potential_buy_price': int(buy_prices[i]),
+                'expected_profit': int(profit_calc['net_profit'][i]),
+                'roi_percent': float(profit_calc['roi_percent'][i])
+            }
         
         return results
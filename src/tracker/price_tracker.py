@@ -6,9 +6,9 @@ This module manages price tracking functionality.
 
 from datetime import datetime
 from typing import Dict, List, Any
-from database.models import Database
-from database.operations import CardOperations, PriceHistoryOperations
-from api.sportscardspro import SportsCardsProAPI
+from ..database.models import Database
+from ..database.operations import CardOperations, PriceHistoryOperations
+from ..api.sportscardspro import SportsCardsProAPI
 
 
 class PriceTracker:
@@ -27,6 +27,37 @@ class PriceTracker:
         self.card_ops = CardOperations(db)
         self.price_ops = PriceHistoryOperations(db)
 
+    def _fetch_card_data(self, card_id: int, refresh: bool = False) -> Dict[str, Any]:
+        """
+        Fetch a card from the API and parse it into database fields.
+
+        Args:
+            card_id: Card ID to fetch
+            refresh: Bypass the API client's response cache (default: False)
+
+        Returns:
+            Parsed card data
+        """
+        response = self.api.get_product(product_id=card_id, refresh=refresh)
+        return self._parse_card_response(response)
+
+    def _parse_card_response(self, response: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Parse a get_product response into database fields.
+
+        Args:
+            response: API response for one card
+
+        Returns:
+            Parsed card data
+        """
+        if isinstance(response, dict) and 'product' in response:
+            product = response['product']
+        else:
+            product = response
+        
+        return self.api.parse_product_data(product)
+
     def track_card(self, card_id: int) -> bool:
         """
         Start tracking a card by fetching its data and storing it.
@@ -39,15 +70,7 @@ class PriceTracker:
         """
         try:
             # Fetch card data from API
-            response = self.api.get_product(product_id=card_id)
-            
-            # Parse the product data
-            if isinstance(response, dict) and 'product' in response:
-                product = response['product']
-            else:
-                product = response
-            
-            card_data = self.api.parse_product_data(product)
+            card_data = self._fetch_card_data(card_id)
             
             # Add or update card in database
             self.card_ops.add_card(card_data)
@@ -72,16 +95,8 @@ class PriceTracker:
             True if successful, False otherwise
         """
         try:
-            # Fetch latest data from API
-            response = self.api.get_product(product_id=card_id)
-            
-            # Parse the product data
-            if isinstance(response, dict) and 'product' in response:
-                product = response['product']
-            else:
-                product = response
-            
-            card_data = self.api.parse_product_data(product)
+            # Fetch latest data from API, never a cached response
+            card_data = self._fetch_card_data(card_id, refresh=True)
             
             # Update card info
             self.card_ops.update_card_timestamp(card_id)
@@ -95,27 +110,50 @@ class PriceTracker:
             print(f"Error updating card {card_id}: {str(e)}")
             return False
 
-    def update_all_prices(self) -> Dict[str, Any]:
+    def update_all_prices(self, max_workers: int = 8) -> Dict[str, Any]:
         """
         Update prices for all tracked cards.
 
+        Cards are fetched in one batched get_products_by_ids call, whose
+        lookups run concurrently since each is dominated by network latency,
+        and bypass the API cache so no snapshot records a stale price; the
+        snapshots are then written from this thread in one batch.
+
+        Args:
+            max_workers: Maximum number of concurrent API lookups (default: 8)
+
         Returns:
             Dictionary with update statistics
         """
-        cards = self.card_ops.get_all_cards()
+        self.price_ops.clear_cache()
+        card_ids = self.card_ops.get_all_card_ids()
+        products = self.api.get_products_by_ids(
+            card_ids, max_workers=max_workers, refresh=True
+        )
         
-        successful = 0
+        snapshots = []
         failed = 0
         
-        for card in cards:
-            if self.update_card_prices(card['id']):
-                successful += 1
-            else:
+        for card_id in card_ids:
+            product = products[card_id]
+            try:
+                # Failed lookups come back as their exception
+                if isinstance(product, Exception):
+                    raise product
+                card_data = self.api.parse_product_data(product)
+            except Exception as e:
+                print(f"Error updating card {card_id}: {str(e)}")
                 failed += 1
+            else:
+                snapshots.append((card_id, card_data))
+        
+        # Write everything at once rather than committing per card
+        self.price_ops.add_price_snapshots(snapshots)
+        self.card_ops.update_card_timestamps(card_id for card_id, _ in snapshots)
         
         return {
-            'total': len(cards),
-            'successful': successful,
+            'total': len(card_ids),
+            'successful': len(snapshots),
             'failed': failed,
             'timestamp': datetime.now().isoformat()
         }
@@ -125,52 +163,34 @@ class PriceTracker:
         Get cards with significant price changes.
 
         Args:
-            days: Number of days to look back (default: 7)
+            days: Only consider cards updated in this many days (default: 7)
 
         Returns:
             List of cards with price change information
         """
-        cards = self.card_ops.get_all_cards()
-        changes = []
-        
-        for card in cards:
-            trend = self.price_ops.get_price_trend(card['id'])
-            
-            if trend is not None and abs(trend) > 5:  # More than 5% change
-                latest_price = self.price_ops.get_latest_price(card['id'])
-                
-                changes.append({
-                    'card_id': card['id'],
-                    'product_name': card['product_name'],
-                    'console_name': card['console_name'],
-                    'trend_percent': trend,
-                    'latest_price': latest_price.get('loose_price', 0) if latest_price else 0
-                })
-        
-        # Sort by absolute trend percentage (descending)
-        changes.sort(key=lambda x: abs(x['trend_percent']), reverse=True)
-        
-        return changes
-
-    def search_and_track(self, search_query: str) -> List[Dict[str, Any]]:
+        # More than 5% change over the 30-day trend window, skipping cards
+        # whose prices have not been refreshed recently
+        return self.price_ops.get_price_changes(
+            min_change_percent=5.0,
+            updated_within_days=days
+        )
+
+    def search_and_track(self, search_query: str, limit: int = 50) -> List[Dict[str, Any]]:
         """
         Search for cards and optionally track them.
 
         Args:
             search_query: Search query string
+            limit: Maximum number of results (default: 50)
 
         Returns:
             List of found products
         """
         try:
-            products = self.api.get_products(search_query)
-            
-            results = []
-            for product in products:
-                parsed = self.api.parse_product_data(product)
-                results.append(parsed)
+            products = self.api.get_products(search_query, limit=limit)
             
-            return results
+            parse = self.api.parse_product_data
+            return [parse(product) for product in products[:limit]]
             
         except Exception as e:
             print(f"Error searching: {str(e)}")
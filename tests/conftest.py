@@ -0,0 +1,92 @@
+"""Shared pytest fixtures."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the repository root to path so the src package imports
+_REPO_ROOT = str(Path(__file__).parent.parent)
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+from src.api.sportscardspro import SportsCardsProAPI
+from src.database.models import Database
+from src.tracker.price_tracker import PriceTracker
+
+
+class ApiStub:
+    """
+    Stand-in for SportsCardsProAPI with no network access.
+
+    get_product returns product_response and records each requested ID in
+    get_product_calls, and in refreshed_ids when the cache is bypassed;
+    get_products_bulk calls get_product per ID, returning failures as
+    values like the client does, and get_products_by_ids is the client's
+    own method over those lookups; parse_product_data returns the next entry
+    of parsed_products, one per call. Tests needing other per-call
+    behaviour assign their own function to a method.
+    """
+
+    def __init__(self):
+        self.product_response = None
+        self.parsed_products = []
+        self.get_product_calls = []
+        self.refreshed_ids = []
+
+    def get_product(self, product_id=None, refresh=False):
+        self.get_product_calls.append(product_id)
+        if refresh:
+            self.refreshed_ids.append(product_id)
+        return self.product_response
+
+    def get_products_bulk(self, product_ids, max_workers=8, refresh=False):
+        responses = []
+        for product_id in product_ids:
+            try:
+                responses.append(self.get_product(product_id=product_id, refresh=refresh))
+            except Exception as e:
+                responses.append(e)
+        return responses
+
+    get_products_by_ids = SportsCardsProAPI.get_products_by_ids
+
+    def parse_product_data(self, product):
+        return self.parsed_products.pop(0)
+
+
+@pytest.fixture(scope="session")
+def schema_template():
+    """Schema-initialized database built once and copied by every test."""
+    template = Database(":memory:")
+    template.initialize_schema()
+
+    yield template.connect()
+
+    template.close()
+
+
+@pytest.fixture
+def db(schema_template):
+    """Fresh database holding a copy of the schema template."""
+    # Database keeps a single connection open, so an in-memory database
+    # lives until close() and no test touches the disk. Copying the
+    # template's pages replaces running the DDL for every test.
+    database = Database(":memory:")
+    schema_template.backup(database.connect())
+
+    yield database
+
+    database.close()
+
+
+@pytest.fixture
+def api_stub():
+    """API stand-in whose responses each test sets directly."""
+    return ApiStub()
+
+
+@pytest.fixture
+def tracker(db, api_stub):
+    """Price tracker over a fresh database."""
+    return PriceTracker(db, api_stub)
@@ -5,10 +5,31 @@ import sys
 from pathlib import Path
 from unittest.mock import Mock, patch
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+import orjson
+import requests
 
-from api.sportscardspro import SportsCardsProAPI, APIError
+# Add the repository root to path so the src package imports
+_REPO_ROOT = str(Path(__file__).parent.parent)
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+from src.api.sportscardspro import MAX_RETRY_AFTER, SportsCardsProAPI, APIError
+
+
+def mock_response(payload):
+    """Build a mock HTTP response whose body is the JSON encoding of payload."""
+    response = Mock()
+    response.content = orjson.dumps(payload)
+    response.raise_for_status = Mock()
+    return response
+
+
+def fake_product_get(url, params=None, timeout=None):
+    """Stand-in for Session.get answering product lookups; ID 2 does not exist."""
+    product_id = int(url.rsplit('=', 1)[1])
+    if product_id == 2:
+        return mock_response({'status': 'error', 'error-message': 'No such product'})
+    return mock_response({'status': 'success', 'product': {'id': product_id}})
 
 
 class TestSportsCardsProAPI(unittest.TestCase):
@@ -24,36 +45,128 @@ class TestSportsCardsProAPI(unittest.TestCase):
         self.assertEqual(self.api.base_url, "https://test.example.com")
         self.assertEqual(self.api.max_retries, 3)
 
-    @patch('api.sportscardspro.requests.Session.get')
+    def test_session_uses_pooled_retrying_adapter(self):
+        """Test the session mounts a pooled adapter that handles retries."""
+        adapter = self.api.session.get_adapter("https://test.example.com")
+        self.assertEqual(adapter.max_retries.total, self.api.max_retries)
+        self.assertIn(503, adapter.max_retries.status_forcelist)
+        self.assertIn(429, adapter.max_retries.status_forcelist)
+        self.assertTrue(adapter.max_retries.respect_retry_after_header)
+
+    def test_retry_after_wait_is_capped(self):
+        """Test a huge Retry-After is cut to MAX_RETRY_AFTER, across retries."""
+        retry = self.api.session.get_adapter("https://test.example.com").max_retries
+        response = Mock()
+
+        response.headers = {'Retry-After': '86400'}
+        self.assertEqual(retry.get_retry_after(response), MAX_RETRY_AFTER)
+        self.assertEqual(retry.increment(method='GET', url='/').get_retry_after(response),
+                         MAX_RETRY_AFTER)
+        response.headers = {'Retry-After': '2'}
+        self.assertEqual(retry.get_retry_after(response), 2)
+        response.headers = {}
+        self.assertIsNone(retry.get_retry_after(response))
+
+    def test_session_is_shared_per_base_url(self):
+        """Test clients for the same base URL reuse one pooled session."""
+        other = SportsCardsProAPI("other_token", "https://test.example.com/")
+        elsewhere = SportsCardsProAPI("test_token", "https://other.example.com")
+
+        self.assertIs(other.session, self.api.session)
+        self.assertIsNot(elsewhere.session, self.api.session)
+
+    @patch('src.api.sportscardspro.requests.Session.get')
     def test_get_product_by_id(self, mock_get):
         """Test fetching product by ID."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_get.return_value = mock_response({
             'status': 'success',
             'product': {
                 'id': 12345,
                 'product-name': 'Test Card',
                 'loose-price': 1000
             }
-        }
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        })
 
         result = self.api.get_product(product_id=12345)
         
         self.assertEqual(result['status'], 'success')
         mock_get.assert_called_once()
+        self.assertEqual(
+            mock_get.call_args[0][0],
+            "https://test.example.com/api/product?t=test_token&id=12345"
+        )
+
+    @patch('src.api.sportscardspro.requests.Session.get')
+    def test_get_product_encodes_id(self, mock_get):
+        """Test a non-integer ID cannot inject extra query parameters."""
+        mock_get.return_value = mock_response({'status': 'success', 'product': {}})
+
+        self.api.get_product(product_id="1&t=other")
+
+        self.assertEqual(
+            mock_get.call_args[0][0],
+            "https://test.example.com/api/product?t=test_token&id=1%26t%3Dother"
+        )
+
+    @patch('src.api.sportscardspro.requests.Session.get')
+    def test_get_product_is_cached(self, mock_get):
+        """Test repeated lookups are served from the cache."""
+        mock_get.return_value = mock_response({'status': 'success', 'product': {'id': 12345}})
+
+        first = self.api.get_product(product_id=12345)
+        second = self.api.get_product(product_id=12345)
+
+        self.assertEqual(first, second)
+        mock_get.assert_called_once()
+
+        self.api.clear_cache()
+        self.api.get_product(product_id=12345)
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch('src.api.sportscardspro.requests.Session.get')
+    def test_get_product_refresh_bypasses_cache(self, mock_get):
+        """Test refresh fetches current data and caches it for later lookups."""
+        mock_get.side_effect = fake_product_get
+
+        self.api.get_product(product_id=1)
+        self.api.get_product(product_id=1, refresh=True)
+        self.assertEqual(mock_get.call_count, 2)
+
+        self.api.get_product(product_id=1)
+        self.api.get_products_bulk([1, 3], refresh=True)
+        self.assertEqual(mock_get.call_count, 4)
 
-    @patch('api.sportscardspro.requests.Session.get')
+    @patch('src.api.sportscardspro.requests.Session.get')
     def test_api_error_handling(self, mock_get):
         """Test API error handling."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_get.return_value = mock_response({
             'status': 'error',
             'error-message': 'Invalid token'
-        }
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        })
+
+        with self.assertRaises(APIError):
+            self.api.get_product(product_id=12345)
+
+    @patch('src.api.sportscardspro.requests.Session.get')
+    def test_request_errors_report_retries_only_when_retried(self, mock_get):
+        """Test a 4xx is reported as is while exhausted retries say so."""
+        response = mock_response({})
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError('404 Not Found')
+        mock_get.return_value = response
+
+        with self.assertRaisesRegex(APIError, r'^Request failed: 404 Not Found$'):
+            self.api.get_product(product_id=12345)
+
+        mock_get.side_effect = requests.exceptions.RetryError('too many 503 error responses')
+        with self.assertRaisesRegex(APIError, r'^Request failed after 3 retries: '):
+            self.api.get_product(product_id=12345, refresh=True)
+
+    @patch('src.api.sportscardspro.requests.Session.get')
+    def test_invalid_json_raises_api_error(self, mock_get):
+        """Test a malformed response body is reported as an API error."""
+        response = mock_response({})
+        response.content = b'<html>Service Unavailable</html>'
+        mock_get.return_value = response
 
         with self.assertRaises(APIError):
             self.api.get_product(product_id=12345)
@@ -66,6 +179,18 @@ class TestSportsCardsProAPI(unittest.TestCase):
         self.assertEqual(self.api._parse_price(''), 0)
         self.assertEqual(self.api._parse_price('invalid'), 0)
 
+    def test_parse_price_strings_are_exact(self):
+        """Test decimal strings convert to cents without float rounding."""
+        self.assertEqual(self.api._parse_price('12.35'), 1235)
+        self.assertEqual(self.api._parse_price('0.29'), 29)
+        self.assertEqual(self.api._parse_price('12.5'), 1250)
+        self.assertEqual(self.api._parse_price('12'), 1200)
+        self.assertEqual(self.api._parse_price('1500'), 1500)
+        self.assertEqual(self.api._parse_price(0.29), 29)
+
+        for cents in range(0, 100000, 7):
+            self.assertEqual(self.api._parse_price(f"{cents // 100}.{cents % 100:02d}"), cents)
+
     def test_parse_product_data(self):
         """Test product data parsing."""
         product = {
@@ -86,6 +211,66 @@ class TestSportsCardsProAPI(unittest.TestCase):
         self.assertEqual(parsed['psa_10_price'], 500000)
         self.assertEqual(parsed['sales_volume'], 100)
 
+    def test_parse_products_data_matches_single_parse(self):
+        """Test batch parsing produces the same values as per-product parsing."""
+        products = [
+            {
+                'id': 1,
+                'product-name': 'Michael Jordan Rookie',
+                'console-name': 'Basketball Cards 1986 Fleer',
+                'loose-price': 50000,
+                'manual-only-price': '12.35',
+                'graded-price': 10.5,
+                'sales-volume': 100
+            },
+            {
+                'id': 2,
+                'product-name': 'Tom Brady Rookie',
+                'console-name': None,
+                'loose-price': None,
+                'manual-only-price': 'invalid',
+                'new-price': '1500',
+                'sales-volume': None
+            }
+        ]
+
+        frame = self.api.parse_products_data(products)
+        expected = [self.api.parse_product_data(p) for p in products]
+
+        self.assertEqual(list(frame.columns), list(expected[0].keys()))
+        self.assertEqual(frame.to_dict('records'), expected)
+        self.assertEqual(expected[1]['console_name'], '')
+        self.assertEqual(expected[1]['sales_volume'], 0)
+
+        streamed = self.api.parse_products_data(p for p in products)
+        self.assertEqual(streamed.to_dict('records'), expected)
+
+    @patch('src.api.sportscardspro.requests.Session.get')
+    def test_get_products_bulk(self, mock_get):
+        """Test concurrent bulk lookups keep input order and capture failures."""
+        mock_get.side_effect = fake_product_get
+
+        results = self.api.get_products_bulk([1, 2, 3])
+
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results[0]['product']['id'], 1)
+        self.assertIsInstance(results[1], APIError)
+        self.assertEqual(results[2]['product']['id'], 3)
+        self.assertEqual(self.api.get_products_bulk([]), [])
+
+    @patch('src.api.sportscardspro.requests.Session.get')
+    def test_get_products_by_ids(self, mock_get):
+        """Test batched lookups dedupe IDs, unwrap products and keep failures."""
+        mock_get.side_effect = fake_product_get
+
+        products = self.api.get_products_by_ids([1, 2, 3, 1])
+
+        self.assertEqual(list(products), [1, 2, 3])
+        self.assertEqual(products[1], {'id': 1})
+        self.assertIsInstance(products[2], APIError)
+        self.assertEqual(products[3], {'id': 3})
+        self.assertEqual(mock_get.call_count, 3)
+
     def test_get_product_validation(self):
         """Test get_product parameter validation."""
         with self.assertRaises(ValueError):
@@ -4,10 +4,12 @@ import unittest
 import sys
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+# Add the repository root to path so the src package imports
+_REPO_ROOT = str(Path(__file__).parent.parent)
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
 
-from calculator.profit_calculator import ProfitCalculator
+from src.calculator.profit_calculator import ProfitCalculator
 
 
 class TestProfitCalculator(unittest.TestCase):
@@ -31,6 +33,14 @@ class TestProfitCalculator(unittest.TestCase):
         fees = self.calculator.calculate_ebay_fees(5000)
         self.assertEqual(fees, 680)
 
+    def test_calculate_ebay_fees_rounds_to_nearest_cent(self):
+        """Test fees are rounded, not truncated."""
+        # $0.99 sale = $0.1287 (13%) + $0.30 = $0.4287 -> $0.43
+        self.assertEqual(self.calculator.calculate_ebay_fees(99), 43)
+
+        # $12.34 sale = $1.6042 (13%) + $0.30 = $1.9042 -> $1.90
+        self.assertEqual(self.calculator.calculate_ebay_fees(1234), 190)
+
     def test_calculate_profit(self):
         """Test profit calculation."""
         # Purchase: $50, Sell: $100, Shipping: $5 (default)
@@ -71,6 +81,91 @@ class TestProfitCalculator(unittest.TestCase):
             self.calculator.is_profitable(9000, 10000, min_profit_margin_percent=10.0)
         )
 
+    def test_calculate_profit_batch_matches_scalar(self):
+        """Test batch profit calculation agrees with the scalar version."""
+        purchases = [5000, 5000, 9000, 0, 1234]
+        markets = [10000, 10000, 10000, 2500, 9999]
+        shipping = [500, 1000, 500, 500, 0]
+
+        batch = self.calculator.calculate_profit_batch(purchases, markets, shipping)
+
+        for i, (purchase, market, ship) in enumerate(zip(purchases, markets, shipping)):
+            expected = self.calculator.calculate_profit(purchase, market, ship)
+            for key, value in expected.items():
+                self.assertEqual(batch[key][i], value, key)
+
+    def test_calculate_profit_batch_roi_matches_scalar_on_grid(self):
+        """Test batch ROI rounds exactly like calculate_profit, half boundaries included."""
+        # Purchase $200, sell $235.30: ROI -0.295% sits on a half boundary
+        self.assertEqual(
+            self.calculator.calculate_profit_batch([20000], [23530])['roi_percent'][0],
+            self.calculator.calculate_profit(20000, 23530)['roi_percent']
+        )
+
+        purchases = [p for p in range(-100, 40001, 397) for _ in range(0, 60001, 611)]
+        markets = [m for _ in range(-100, 40001, 397) for m in range(0, 60001, 611)]
+        batch = self.calculator.calculate_profit_batch(purchases, markets)
+
+        expected = [
+            self.calculator.calculate_profit(p, m)['roi_percent']
+            for p, m in zip(purchases, markets)
+        ]
+        self.assertEqual(batch['roi_percent'].tolist(), expected)
+
+    def test_calculate_profit_batch_default_shipping(self):
+        """Test batch profit calculation uses default shipping when omitted."""
+        batch = self.calculator.calculate_profit_batch([5000], [10000])
+
+        self.assertEqual(batch['shipping_cost'][0], 500)
+        self.assertEqual(batch['net_profit'][0], 3170)
+
+    def test_calculate_profit_batch_broadcasts_scalar_market(self):
+        """Test one market value is applied to an array of purchase prices."""
+        batch = self.calculator.calculate_profit_batch([5000, 6000], 10000)
+
+        self.assertEqual(list(batch['market_value']), [10000, 10000])
+        self.assertEqual(list(batch['net_profit']), [3170, 2170])
+        self.assertEqual(
+            list(self.calculator.is_profitable_batch([5000, 9000], [10000])),
+            [True, False]
+        )
+
+    def test_is_profitable_batch(self):
+        """Test batch profitability check."""
+        result = self.calculator.is_profitable_batch(
+            [5000, 9000], [10000, 10000], min_profit_margin_percent=10.0
+        )
+
+        self.assertEqual(list(result), [True, False])
+
+    def test_is_profitable_at_margin_boundary(self):
+        """Test the margin check is inclusive and exact at the boundary."""
+        # Purchase $50, sell $100: net $31.70, ROI exactly 63.4%
+        self.assertTrue(
+            self.calculator.is_profitable(5000, 10000, min_profit_margin_percent=63.4)
+        )
+        self.assertFalse(
+            self.calculator.is_profitable(5000, 10000, min_profit_margin_percent=63.41)
+        )
+        self.assertFalse(self.calculator.is_profitable(0, 10000))
+
+    def test_is_profitable_batch_agrees_with_scalar(self):
+        """Test the batch margin check matches is_profitable at the boundary."""
+        # Rounding ROI to 2 places first would call this one profitable
+        cases = [(72456, 48893, -42.02), (5000, 10000, 63.4), (5000, 10000, 63.41)]
+        # Every case sitting exactly on its own ROI, plus zero purchase prices
+        for purchase, market in [(1234, 9999), (777, 1500), (9000, 10000), (0, 2500)]:
+            roi = self.calculator.calculate_profit(purchase, market)['roi_percent']
+            cases += [(purchase, market, roi), (purchase, market, roi + 0.01)]
+
+        for purchase, market, margin in cases:
+            batch = self.calculator.is_profitable_batch([purchase], [market], margin)
+            self.assertEqual(
+                bool(batch[0]),
+                self.calculator.is_profitable(purchase, market, margin),
+                (purchase, market, margin)
+            )
+
     def test_format_currency(self):
         """Test currency formatting."""
         self.assertEqual(self.calculator.format_currency(1234), "$12.34")
@@ -0,0 +1,97 @@
+"""Tests for the command-line interface."""
+
+import json
+import os
+
+import pytest
+import yaml
+
+# conftest puts the repository root on sys.path
+from src.cli import build_parser, cli, inventory, load_config
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    """A config.yaml with one business setting."""
+    path = tmp_path / 'config.yaml'
+    path.write_text("business:\n  ebay_fee_percent: 13.0\n")
+    return str(path)
+
+
+def no_yaml(*args, **kwargs):
+    """Stand-in for yaml.load that fails the test if called."""
+    raise AssertionError("YAML should not be parsed")
+
+
+def test_load_config_writes_and_reuses_json_cache(config_path, monkeypatch):
+    """Test a second load is served from the JSON cache without parsing YAML."""
+    config = load_config(config_path)
+
+    assert config == {'business': {'ebay_fee_percent': 13.0}}
+    with open(config_path + '.cache.json') as f:
+        cached = json.load(f)
+    assert cached == {'mtime_ns': os.stat(config_path).st_mtime_ns, 'config': config}
+
+    monkeypatch.setattr(yaml, 'load', no_yaml)
+    assert load_config(config_path) == config
+
+
+def test_load_config_reparses_when_yaml_changes(config_path):
+    """Test editing config.yaml invalidates the cache via its mtime."""
+    load_config(config_path)
+
+    with open(config_path, 'w') as f:
+        f.write("business:\n  ebay_fee_percent: 12.5\n")
+    stat = os.stat(config_path)
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert load_config(config_path) == {'business': {'ebay_fee_percent': 12.5}}
+
+
+def test_load_config_falls_back_to_yaml_on_corrupt_cache(config_path):
+    """Test an unreadable cache is ignored and rewritten."""
+    cache_path = config_path + '.cache.json'
+    with open(cache_path, 'w') as f:
+        f.write('{"mtime_ns": ')
+
+    assert load_config(config_path) == {'business': {'ebay_fee_percent': 13.0}}
+    with open(cache_path) as f:
+        assert json.load(f)['config'] == {'business': {'ebay_fee_percent': 13.0}}
+
+
+def test_build_parser_maps_subcommands_to_functions():
+    """Test subcommand options parse to the command function's arguments."""
+    args = build_parser().parse_args(['inventory', '--status', 'sold', '--limit', '5'])
+
+    assert args.func is inventory
+    assert (args.status, args.limit, args.offset) == ('sold', 5, 0)
+
+    with pytest.raises(SystemExit):
+        build_parser().parse_args(['inventory', '--status', 'lost'])
+
+
+def test_cli_without_command_prints_help(tmp_path, monkeypatch, capsys):
+    """Test a bare invocation prints help without loading any config."""
+    monkeypatch.chdir(tmp_path)
+
+    assert cli([]) == 0
+    assert 'calc-profit' in capsys.readouterr().out
+
+
+def test_cli_missing_required_option_exits(capsys):
+    """Test argparse rejects a command missing a required option."""
+    with pytest.raises(SystemExit) as exc:
+        cli(['track'])
+
+    assert exc.value.code == 2
+    assert '--id' in capsys.readouterr().err
+
+
+def test_cli_runs_command_without_opening_database(tmp_path, config_path, monkeypatch, capsys):
+    """Test calc-profit runs from the config alone and never creates the database."""
+    monkeypatch.chdir(tmp_path)
+
+    assert cli(['calc-profit', '--purchase-price', '50', '--market-value', '100']) == 0
+
+    assert 'Net Profit:      $31.70' in capsys.readouterr().out
+    assert not (tmp_path / 'sportscards.db').exists()
@@ -0,0 +1,115 @@
+"""Tests for deal finder."""
+
+import pytest
+
+# conftest puts the repository root on sys.path
+from src.calculator.profit_calculator import ProfitCalculator
+from src.database.operations import CardOperations, PriceHistoryOperations
+from src.tracker.deal_finder import DealFinder
+
+# card_id -> (genre, loose price 20 days ago, latest loose price)
+HISTORY = {
+    1: ('Baseball Card', 300000, 200000),     # -33%
+    2: ('Basketball Card', 120000, 100000),   # -17%
+    3: ('Baseball Card', 100000, 97000),      # -3%, too small a drop
+    4: ('Baseball Card', 100000, 150000),     # rising
+    5: ('Baseball Card', 600000, 500000),     # -17%
+    6: ('Football Card', 100000, 0),          # no current price
+}
+
+
+def add_history(db, history):
+    """Add each card in a HISTORY-style mapping with its two snapshots."""
+    conn = db.connect()
+    for card_id, (genre, oldest, latest) in history.items():
+        CardOperations(db).add_card({
+            'id': card_id,
+            'product_name': f'Card {card_id}',
+            'genre': genre
+        })
+        conn.executemany(
+            "INSERT INTO price_history (card_id, timestamp, loose_price) "
+            "VALUES (?, datetime('now', ?), ?)",
+            [(card_id, '-20 days', oldest), (card_id, '-1 days', latest)]
+        )
+    conn.commit()
+
+
+@pytest.fixture
+def deal_finder(db):
+    """Deal finder over the cards in HISTORY."""
+    add_history(db, HISTORY)
+    return DealFinder(db, ProfitCalculator())
+
+
+def deal_ids(deals):
+    """Card IDs of a list of deals, in order."""
+    return [deal['card_id'] for deal in deals]
+
+
+def test_find_deals_reports_dropping_cards_best_roi_first(deal_finder):
+    """Test only cards down more than 5% with a current price are reported."""
+    deals = deal_finder.find_deals(min_roi=0)
+
+    # ROI at an 85% buy price: card 5 2.23%, card 1 2.04%, card 2 1.73%
+    assert deal_ids(deals) == [5, 1, 2]
+    assert deals[1] == {
+        'card_id': 1,
+        'product_name': 'Card 1',
+        'console_name': '',
+        'genre': 'Baseball Card',
+        'market_price': 200000,
+        'potential_buy_price': 170000,
+        'price_trend': -33.33,
+        'expected_profit': 200000 - 170000 - 26030 - 500,
+        'roi_percent': 2.04
+    }
+
+
+def test_find_deals_filters(deal_finder):
+    """Test the sport, price range, ROI and limit filters."""
+    assert deal_ids(deal_finder.find_deals(sport='Basketball', min_roi=0)) == [2]
+    assert deal_ids(deal_finder.find_deals(price_range=(150000, 250000), min_roi=0)) == [1]
+    assert deal_ids(deal_finder.find_deals(min_roi=2.04)) == [5, 1]
+    assert deal_ids(deal_finder.find_deals(min_roi=0, limit=2)) == [5, 1]
+    # The default 15% minimum is not reachable at a 15% discount
+    assert deal_finder.find_deals() == []
+
+
+def test_find_deals_boundaries_match_scalar_helpers(deal_finder):
+    """Test ROI and trend cut-offs agree with calculate_profit and get_price_trend."""
+    add_history(deal_finder.db, {
+        7: ('Baseball Card', 100000, 80001),   # buying at 68000 is 1.57% ROI
+        8: ('Baseball Card', 20000, 18999),    # -5.005% rounds to -5.0
+    })
+
+    assert deal_ids(deal_finder.find_deals(min_roi=1.58)) == [5, 1, 2]
+    assert deal_ids(deal_finder.find_deals(min_roi=1.57)) == [5, 1, 2, 7]
+
+    deals = deal_finder.find_deals(min_roi=-100)
+    assert 8 not in deal_ids(deals)
+    for deal in deals:
+        assert deal['price_trend'] == deal_finder.price_ops.get_price_trend(deal['card_id'])
+        assert deal['roi_percent'] == deal_finder.calculator.calculate_profit(
+            deal['potential_buy_price'], deal['market_price']
+        )['roi_percent']
+
+
+def test_compare_conditions_matches_calculate_profit(db):
+    """Test per-condition ROI matches the scalar calculator at rounding edges."""
+    CardOperations(db).add_card({'id': 1, 'product_name': 'Card 1'})
+    # 68000 against 80001 and 20000 against 23530 both sit on a rounding edge
+    PriceHistoryOperations(db).add_price_snapshot(
+        1, {'loose_price': 80001, 'psa_10_price': 23530}
+    )
+    calculator = ProfitCalculator()
+
+    results = DealFinder(db, calculator).compare_conditions(1)
+
+    assert list(results) == ['ungraded', 'psa_10']
+    assert results['ungraded']['roi_percent'] == 1.57
+    assert results['psa_10']['roi_percent'] == -0.29
+    for result in results.values():
+        assert result['roi_percent'] == calculator.calculate_profit(
+            result['potential_buy_price'], result['market_value']
+        )['roi_percent']
@@ -0,0 +1,42 @@
+"""Tests for database schema management."""
+
+# conftest puts the repository root on sys.path
+from src.database.models import SCHEMA_VERSION, Database
+
+
+def index_names(conn):
+    """Names of the indexes defined in the database."""
+    rows = conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'").fetchall()
+    return {row['name'] for row in rows}
+
+
+def test_initialize_schema_skips_current_database():
+    """Test a database at SCHEMA_VERSION only has its version checked."""
+    db = Database(":memory:")
+    db.initialize_schema()
+    conn = db.connect()
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+
+    statements = []
+    conn.set_trace_callback(statements.append)
+    db.initialize_schema()
+    conn.set_trace_callback(None)
+
+    assert statements == ["PRAGMA user_version"]
+    db.close()
+
+
+def test_initialize_schema_upgrades_older_database():
+    """Test an older schema version is migrated and stamped current."""
+    db = Database(":memory:")
+    db.initialize_schema()
+    conn = db.connect()
+    conn.execute("CREATE INDEX idx_price_history_card_id ON price_history(card_id)")
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION - 1}")
+
+    db.initialize_schema()
+
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+    assert 'idx_price_history_card_id' not in index_names(conn)
+    assert {'idx_ph_card_ts', 'idx_inv_sold_card', 'idx_inv_sold_sold_date'} <= index_names(conn)
+    db.close()
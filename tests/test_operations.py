@@ -0,0 +1,154 @@
+"""Tests for database operations."""
+
+# conftest puts the repository root on sys.path
+from src.database.operations import CardOperations, InventoryOperations, PriceHistoryOperations
+
+
+def add_item(db, purchase_price=1000, cost_basis=1200):
+    """Add one unsold copy of card 1 to inventory and return its ID."""
+    CardOperations(db).add_card({'id': 1, 'product_name': 'Card 1'})
+    return InventoryOperations(db).add_inventory_item({
+        'card_id': 1,
+        'purchase_date': '2024-01-01',
+        'purchase_price': purchase_price,
+        'condition': 'Raw',
+        'cost_basis': cost_basis
+    })
+
+
+def test_get_latest_price_breaks_timestamp_ties_on_id(db):
+    """Test the last snapshot written wins when two share a timestamp."""
+    CardOperations(db).add_card({'id': 1, 'product_name': 'Card 1'})
+    conn = db.connect()
+    conn.executemany(
+        "INSERT INTO price_history (card_id, timestamp, loose_price) "
+        "VALUES (1, '2024-01-01 12:00:00', ?)",
+        [(1000,), (1200,)]
+    )
+    conn.commit()
+
+    assert PriceHistoryOperations(db).get_latest_price(1)['loose_price'] == 1200
+
+
+def test_add_price_snapshots_writes_full_chunks_and_remainder(db):
+    """Test 250 snapshots land as two multi-row chunks plus a 50-row tail."""
+    price_ops = PriceHistoryOperations(db)
+    snapshots = [
+        (card_id, {'loose_price': card_id * 10, 'sales_volume': card_id})
+        for card_id in range(1, 251)
+    ]
+
+    assert price_ops.add_price_snapshots(snapshots) == 250
+
+    rows = db.connect().execute(
+        "SELECT card_id, loose_price, psa_10_price, sales_volume FROM price_history ORDER BY id"
+    ).fetchall()
+    assert [tuple(row) for row in rows] == [
+        (card_id, card_id * 10, 0, card_id) for card_id in range(1, 251)
+    ]
+
+
+def test_record_sale_computes_profit_from_stored_cost_basis(db):
+    """Test net profit uses the item's cost basis, not its purchase price."""
+    inventory_ops = InventoryOperations(db)
+    item_id = add_item(db, purchase_price=1000, cost_basis=1200)
+
+    assert inventory_ops.record_sale(item_id, '2024-03-15', 5000, 680)
+
+    item = inventory_ops.get_inventory_item(item_id)
+    assert item['sold'] == 1
+    assert (item['sold_date'], item['sold_price'], item['ebay_fees']) == ('2024-03-15', 5000, 680)
+    assert item['net_profit'] == 5000 - 1200 - 680
+
+
+def test_record_sale_stores_zero_padded_dates(db):
+    """Test an unpadded sale date is stored so both reports count it."""
+    inventory_ops = InventoryOperations(db)
+    item_id = add_item(db)
+
+    assert inventory_ops.record_sale(item_id, '2024-3-05', 5000, 680)
+
+    assert inventory_ops.get_inventory_item(item_id)['sold_date'] == '2024-03-05'
+    assert inventory_ops.get_monthly_report(2024, 3)['total_sales'] == 1
+    assert inventory_ops.get_yearly_report(2024)[3]['total_sales'] == 1
+
+
+def test_record_sale_missing_item(db):
+    """Test recording a sale for an unknown inventory ID reports failure."""
+    assert not InventoryOperations(db).record_sale(999, '2024-03-15', 5000, 680)
+
+
+def test_get_yearly_report(db):
+    """Test the yearly report zero-fills empty months and matches monthly reports."""
+    inventory_ops = InventoryOperations(db)
+    sales = [
+        ('2023-12-31', 3000, 400),   # previous year
+        ('2024-03-01', 5000, 680),
+        ('2024-03-31', 2000, 290),
+        ('2024-11-15', 9000, 1200),
+        ('2025-01-01', 4000, 550),   # next year
+    ]
+    for sold_date, sold_price, fees in sales:
+        inventory_ops.record_sale(add_item(db), sold_date, sold_price, fees)
+
+    report = inventory_ops.get_yearly_report(2024)
+
+    assert sorted(report) == list(range(1, 13))
+    assert report[3] == inventory_ops.get_monthly_report(2024, 3)
+    assert report[3] == {
+        'total_sales': 2,
+        'total_revenue': 7000,
+        'total_cost': 2400,
+        'total_fees': 970,
+        'total_profit': 7000 - 2400 - 970
+    }
+    assert report[11] == inventory_ops.get_monthly_report(2024, 11)
+    assert report[11]['total_sales'] == 1
+
+    empty = {
+        'total_sales': 0,
+        'total_revenue': 0,
+        'total_cost': 0,
+        'total_fees': 0,
+        'total_profit': 0
+    }
+    for month in (1, 2, 4, 5, 6, 7, 8, 9, 10, 12):
+        assert report[month] == empty
+        assert inventory_ops.get_monthly_report(2024, month) == empty
+
+
+def test_latest_price_cache_is_invalidated_by_writes(db):
+    """Test cached latest prices are reused until the next write."""
+    price_ops = PriceHistoryOperations(db)
+    price_ops.add_price_snapshot(1, {'loose_price': 1000})
+
+    fetches = []
+    fetch = price_ops._fetch_latest_price
+    price_ops._fetch_latest_price = lambda card_id: fetches.append(card_id) or fetch(card_id)
+
+    first = price_ops.get_latest_price(1)
+    first['loose_price'] = 0   # callers get a copy, not the cached row
+    assert price_ops.get_latest_price(1)['loose_price'] == 1000
+    assert fetches == [1]
+
+    price_ops.add_price_snapshot(1, {'loose_price': 1200})
+
+    assert price_ops.get_latest_price(1)['loose_price'] == 1200
+    assert fetches == [1, 1]
+
+
+def test_get_price_changes_rounds_trends_like_get_price_trend(db):
+    """Test trends are rounded and thresholded as get_price_trend rounds them."""
+    card_ops = CardOperations(db)
+    price_ops = PriceHistoryOperations(db)
+    for card_id, prices in ((1, (20000, 21001)), (2, (8000, 6))):
+        card_ops.add_card({'id': card_id, 'product_name': f'Card {card_id}'})
+        for price in prices:
+            price_ops.add_price_snapshot(card_id, {'loose_price': price})
+
+    # 5.005 rounds to 5.0, which is not more than 5
+    assert price_ops.get_price_trend(1) == 5.0
+    assert price_ops.get_price_trend(2) == -99.92
+
+    changes = price_ops.get_price_changes(min_change_percent=5.0)
+    assert [(change['card_id'], change['trend_percent']) for change in changes] == [(2, -99.92)]
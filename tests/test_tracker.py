@@ -1,109 +1,139 @@
 """Tests for price tracker."""
 
-import unittest
-import tempfile
-import os
-import sys
-from pathlib import Path
-from unittest.mock import Mock, patch
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
-
-from database.models import Database
-from tracker.price_tracker import PriceTracker
-from api.sportscardspro import SportsCardsProAPI
-
-
-class TestPriceTracker(unittest.TestCase):
-    """Test cases for price tracker."""
-
-    def setUp(self):
-        """Set up test fixtures."""
-        # Create temporary database
-        self.db_fd, self.db_path = tempfile.mkstemp()
-        self.db = Database(self.db_path)
-        self.db.initialize_schema()
-
-        # Mock API
-        self.mock_api = Mock(spec=SportsCardsProAPI)
-        
-        self.tracker = PriceTracker(self.db, self.mock_api)
-
-    def tearDown(self):
-        """Clean up test fixtures."""
-        self.db.close()
-        os.close(self.db_fd)
-        os.unlink(self.db_path)
-
-    def test_track_card_success(self):
-        """Test successful card tracking."""
-        # Mock API response
-        self.mock_api.get_product.return_value = {
-            'status': 'success',
-            'product': {
-                'id': 12345,
-                'product-name': 'Test Card',
-                'console-name': 'Test Set',
-                'genre': 'Baseball Card',
-                'loose-price': 1000
-            }
-        }
-        
-        self.mock_api.parse_product_data.return_value = {
-            'id': 12345,
-            'product_name': 'Test Card',
-            'console_name': 'Test Set',
-            'genre': 'Baseball Card',
-            'loose_price': 1000,
-            'psa_10_price': 5000,
-            'grade_9_price': 0,
-            'grade_8_price': 0,
-            'bgs_10_price': 0,
-            'cgc_10_price': 0,
-            'sgc_10_price': 0,
-            'sales_volume': 10
-        }
-
-        result = self.tracker.track_card(12345)
-        
-        self.assertTrue(result)
-        self.mock_api.get_product.assert_called_once_with(product_id=12345)
-
-    def test_update_card_prices(self):
-        """Test price update."""
-        # First track the card
-        self.mock_api.get_product.return_value = {
-            'product': {
-                'id': 12345,
-                'product-name': 'Test Card',
-                'loose-price': 1000
-            }
-        }
-        
-        self.mock_api.parse_product_data.return_value = {
-            'id': 12345,
-            'product_name': 'Test Card',
-            'console_name': 'Test Set',
-            'genre': 'Baseball Card',
-            'loose_price': 1000,
-            'psa_10_price': 5000,
-            'grade_9_price': 0,
-            'grade_8_price': 0,
-            'bgs_10_price': 0,
-            'cgc_10_price': 0,
-            'sgc_10_price': 0,
-            'sales_volume': 10
-        }
-        
-        self.tracker.track_card(12345)
-        
-        # Update prices
-        self.mock_api.parse_product_data.return_value['loose_price'] = 1200
-        result = self.tracker.update_card_prices(12345)
-        
-        self.assertTrue(result)
-
-
-if __name__ == '__main__':
-    unittest.main()
+import inspect
+from types import MappingProxyType
+
+import pytest
+
+# conftest puts the repository root on sys.path
+from src.api.sportscardspro import SportsCardsProAPI
+
+
+# Raw API response and the parsed product the stub returns for it
+PRODUCT_RESPONSE = {
+    'status': 'success',
+    'product': {
+        'id': 12345,
+        'product-name': 'Test Card',
+        'console-name': 'Test Set',
+        'genre': 'Baseball Card',
+        'loose-price': 1000
+    }
+}
+
+# Read-only, so tests can only hand out copies of it
+BASE_PRODUCT = MappingProxyType({
+    'id': 12345,
+    'product_name': 'Test Card',
+    'console_name': 'Test Set',
+    'genre': 'Baseball Card',
+    'loose_price': 1000,
+    'psa_10_price': 5000,
+    'grade_9_price': 0,
+    'grade_8_price': 0,
+    'bgs_10_price': 0,
+    'cgc_10_price': 0,
+    'sgc_10_price': 0,
+    'sales_volume': 10
+})
+
+
+def test_api_stub_matches_client(api_stub):
+    """Test the stub only stands in for client methods with the same parameters."""
+    for name in ('get_product', 'get_products_bulk', 'parse_product_data'):
+        client_params = inspect.signature(getattr(SportsCardsProAPI, name)).parameters
+        stub_params = inspect.signature(getattr(api_stub, name)).parameters
+        assert set(stub_params) <= set(client_params) - {'self'}
+
+
+@pytest.fixture
+def tracked_card(tracker, api_stub):
+    """Card 12345 tracked at BASE_PRODUCT prices."""
+    api_stub.product_response = PRODUCT_RESPONSE
+    api_stub.parsed_products = [dict(BASE_PRODUCT)]
+    assert tracker.track_card(12345)
+    return 12345
+
+
+def test_track_card_success(tracker, api_stub, tracked_card):
+    """Test successful card tracking."""
+    assert api_stub.get_product_calls == [tracked_card]
+    assert tracker.card_ops.get_card(tracked_card)['product_name'] == 'Test Card'
+    assert tracker.price_ops.get_latest_price(tracked_card)['loose_price'] == 1000
+
+
+@pytest.mark.parametrize("loose_price", [1000, 1200])
+def test_update_card_prices(tracker, api_stub, tracked_card, loose_price):
+    """Test updating a tracked card's prices."""
+    api_stub.parsed_products.append(BASE_PRODUCT | {'loose_price': loose_price})
+
+    assert tracker.update_card_prices(tracked_card)
+    # Only the update bypasses the API cache
+    assert api_stub.refreshed_ids == [tracked_card]
+    assert tracker.price_ops.get_latest_price(tracked_card)['loose_price'] == loose_price
+
+
+def test_update_all_prices_batches_snapshots(tracker, api_stub):
+    """Test bulk update writes one snapshot per card and counts failures."""
+    for card_id in (1, 2, 3):
+        tracker.card_ops.add_card({'id': card_id, 'product_name': f'Card {card_id}'})
+
+    def fake_get_product(product_id=None, refresh=False):
+        assert refresh
+        if product_id == 2:
+            raise ValueError("lookup failed")
+        return {'product': {'id': product_id}}
+
+    api_stub.get_product = fake_get_product
+    api_stub.parse_product_data = lambda product: {
+        'id': product['id'],
+        'loose_price': product['id'] * 100
+    }
+
+    result = tracker.update_all_prices()
+
+    assert result['total'] == 3
+    assert result['successful'] == 2
+    assert result['failed'] == 1
+
+    rows = tracker.db.connect().execute(
+        "SELECT card_id, loose_price, psa_10_price FROM price_history ORDER BY card_id"
+    ).fetchall()
+    assert [tuple(row) for row in rows] == [(1, 100, 0), (3, 300, 0)]
+
+
+def test_get_price_changes(tracker):
+    """Test only cards moving more than 5% over 30 days are reported."""
+    conn = tracker.db.connect()
+    history = {
+        1: [('-20 days', 1000), ('-1 days', 1500)],   # +50%
+        2: [('-20 days', 1000), ('-1 days', 1020)],   # +2%, too small
+        3: [('-20 days', 2500), ('-1 days', 1000)],   # -60%
+        4: [('-60 days', 1000), ('-1 days', 2000)],   # one snapshot in window
+        5: [('-20 days', 0), ('-1 days', 1000)],      # no starting price
+    }
+    for card_id, snapshots in history.items():
+        tracker.card_ops.add_card({'id': card_id, 'product_name': f'Card {card_id}'})
+        for offset, price in snapshots:
+            conn.execute(
+                "INSERT INTO price_history (card_id, timestamp, loose_price) "
+                "VALUES (?, datetime('now', ?), ?)",
+                (card_id, offset, price)
+            )
+    conn.commit()
+
+    changes = tracker.get_price_changes()
+
+    assert [(c['card_id'], c['trend_percent'], c['latest_price']) for c in changes] == [
+        (3, -60.0, 1000),
+        (1, 50.0, 1500)
+    ]
+
+    # A card whose prices were not refreshed this week is skipped
+    conn.execute("UPDATE cards SET last_updated = datetime('now', '-10 days') WHERE id = 3")
+    conn.commit()
+
+    changes = tracker.get_price_changes()
+    assert [c['card_id'] for c in changes] == [1]
+    assert [c['card_id'] for c in tracker.price_ops.get_price_changes()] == [3, 1]
+